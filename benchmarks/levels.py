@@ -0,0 +1,144 @@
+"""
+Definition:
+Generator for synthetic levels of arbitrary size, written in the same JSON schema as
+assets/levels/world-*.json.
+
+Responsibilities:
+- Lay down a grass-and-dirt floor broken up by water-filled pits
+- Scatter floating block platforms, gems and enemies (spikemen, spikeballs, clouds, fish)
+  at configurable densities
+- Place the start point and, optionally, the goal flag and pole
+- Produce the same level for the same seed so benchmark runs are comparable
+
+Trigger / Usage:
+- Called by benchmarks.run to build each benchmark level.
+- Can be run directly to save a level for inspection or play-testing:
+    python -m benchmarks.levels --width 1000 --height 16 -o big.json
+"""
+
+# Standard Library Imports
+import argparse
+import json
+import random
+
+# Third-Party Imports
+
+# Local Imports
+
+
+DEFAULT_DENSITIES = {
+    'platforms': 0.15,   # chance of a floating block per column
+    'water': 0.08,       # chance of a pit starting at a column
+    'spikemen': 0.04,    # per floor column
+    'spikeballs': 0.02,  # per floor column
+    'clouds': 0.01,      # per column
+    'fish': 0.25,        # per water column
+    'gems': 0.10,        # per column
+}
+
+
+def generate_level(width=200, height=12, densities=None, seed=0, goal=True):
+    rates = dict(DEFAULT_DENSITIES)
+    if densities is not None:
+        rates.update(densities)
+
+    rnd = random.Random(seed)
+
+    surface = height - 2  # row of the grass surface
+    start_x = 2
+    goal_x = width - 3
+
+    level = {
+        'title': f"Synthetic {width}x{height} (seed {seed})",
+        'width': width,
+        'height': height,
+        'start': [start_x, surface - 1],
+        'grass_dirt': [],
+        'dirt': [],
+        'blocks': [],
+        'water_tops': [],
+        'water': [],
+        'clouds': [],
+        'spikeballs': [],
+        'spikemen': [],
+        'fish': [],
+        'gems': [],
+        'goals': [],
+    }
+
+    # Floor, with pits of water away from the start and goal
+    x = 0
+    while x < width:
+        safe = x <= start_x + 2 or x >= goal_x - 2
+
+        if not safe and rnd.random() < rates['water']:
+            pit_width = rnd.randint(2, 5)
+
+            for pit_x in range(x, min(x + pit_width, goal_x - 2)):
+                level['water_tops'].append([pit_x, surface])
+
+                for y in range(surface + 1, height):
+                    level['water'].append([pit_x, y])
+
+                if rnd.random() < rates['fish']:
+                    level['fish'].append([pit_x, height - 1])
+
+            x += pit_width
+            continue
+
+        level['grass_dirt'].append([x, surface])
+
+        for y in range(surface + 1, height):
+            level['dirt'].append([x, y])
+
+        if not safe:
+            if rnd.random() < rates['spikemen']:
+                level['spikemen'].append([x, surface - 1])
+            elif rnd.random() < rates['spikeballs']:
+                level['spikeballs'].append([x, surface - 1])
+
+        x += 1
+
+    # Floating platforms, gems and clouds
+    for x in range(width):
+        if height > 6 and rnd.random() < rates['platforms']:
+            y = rnd.randint(2, surface - 3)
+            level['blocks'].append([x, y])
+
+            if rnd.random() < rates['gems']:
+                level['gems'].append([x, y - 1])
+        elif rnd.random() < rates['gems']:
+            level['gems'].append([x, surface - 1])
+
+        if rnd.random() < rates['clouds']:
+            level['clouds'].append([x, rnd.randint(0, 1)])
+
+    # Goal (flag first, then pole segments down to the floor)
+    if goal:
+        for y in range(max(0, surface - 5), surface):
+            level['goals'].append([goal_x, y])
+
+    return level
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic level.")
+    parser.add_argument('--width', type=int, default=200)
+    parser.add_argument('--height', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-goal', action='store_true', help="leave out the goal flag")
+    parser.add_argument('-o', '--output', help="file to write (default: stdout)")
+    args = parser.parse_args()
+
+    level = generate_level(args.width, args.height, seed=args.seed, goal=not args.no_goal)
+    text = json.dumps(level)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Definition:
+Replays a recorded play session in a headless game, as fast as possible, and times it.
+
+Responsibilities:
+- Load a recording made with settings.RECORD_INPUT_FILE (see platformer.replay)
+- Feed it to a headless Game tick by tick through Game.step()
+- Check the world state hash after every tick and report the first tick that differs
+- Report avg/p95/max ms per frame, optionally as JSON, for comparing commits on the same
+  realistic session (e.g. while bisecting a performance regression)
+
+Trigger / Usage:
+- Run from the repository root so asset paths resolve:
+    python -m benchmarks.replay session.rec
+    python -m benchmarks.replay session.rec --no-render --json replay.json
+- Exits with status 1 when the replay doesn't reproduce the recording.
+"""
+
+# Standard Library Imports
+import argparse
+import json
+import sys
+import time
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+from platformer.game import Game
+from platformer.replay import InputReplay
+from benchmarks.run import summarize
+
+
+def run_replay(game, replay, verify=True):
+    replay.start(game)
+    samples = []
+
+    for frame, inputs in enumerate(replay):
+        start = time.perf_counter()
+        game.step(1, [inputs])
+        samples.append((time.perf_counter() - start) * 1000)
+
+        if verify:
+            replay.check(game, frame)
+
+        if not game.running:
+            break
+
+    return {
+        'frames': len(samples),
+        'recorded_frames': len(replay),
+        'mismatches': len(replay.mismatches),
+        'first_mismatch': replay.mismatches[0] if replay.mismatches else None,
+        'level': game.level,
+        'score': game.score,
+        'hearts': game.hero.hearts,
+        'ms_per_frame': summarize(samples) if samples else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless.")
+    parser.add_argument('recording')
+    parser.add_argument('--no-render', action='store_true', help="skip Game.render (simulation only)")
+    parser.add_argument('--no-verify', action='store_true', help="don't check world state hashes")
+    parser.add_argument('--json', help="also write the result to this file")
+    args = parser.parse_args()
+
+    game = Game(headless=True, render=not args.no_render)
+    replay = InputReplay(args.recording)
+    result = run_replay(game, replay, verify=not args.no_verify)
+
+    print(f"{args.recording}: {result['frames']} of {result['recorded_frames']} frames, "
+          f"level {result['level']}, score {result['score']}, hearts {result['hearts']}")
+
+    if result['ms_per_frame'] is not None:
+        stats = result['ms_per_frame']
+        print(f"  ms/frame: avg {stats['avg']:.3f}, p95 {stats['p95']:.3f}, max {stats['max']:.3f}")
+
+    if args.no_verify:
+        print("  world state not verified")
+    elif result['mismatches']:
+        print(f"  world state differs from the recording on {result['mismatches']} frames, first at frame {result['first_mismatch']}")
+    else:
+        print("  world state matches the recording on every frame")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    pygame.quit()
+
+    if result['mismatches']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Definition:
+Benchmark runner that measures how level loading, simulation and rendering scale with level size.
+
+Responsibilities:
+- Generate synthetic levels of several sizes (see benchmarks.levels)
+- Build each level in a headless Game and time World construction (load time)
+- Run a fixed number of frames with scripted input (run, jump, turn at the world edges)
+- Time each frame by phase: input, Game.update (with World.update inside it),
+  Game.render (with World.draw_background and World.draw_sprites inside it)
+- Report avg/p95 ms per phase and per frame, optionally as JSON for tracking regressions
+
+Trigger / Usage:
+- Run from the repository root so asset paths resolve:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 40x9 1000x16 --frames 1200 --json bench.json
+    python -m benchmarks.run --batched-enemies --density spikemen=0.5 clouds=0.2
+    python -m benchmarks.run --sizes 4000x16 --streaming
+"""
+
+# Standard Library Imports
+import argparse
+import json
+import time
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+from platformer.game import Game, HeldKeys
+from benchmarks.levels import generate_level
+
+
+DEFAULT_SIZES = ['40x9', '250x12', '1000x16']
+
+PHASES = ['input', 'update', 'world.update', 'render', 'world.draw']
+
+JUMP_INTERVAL = 45  # frames between scripted jumps
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+def summarize(samples):
+    return {
+        'avg': sum(samples) / len(samples),
+        'p95': percentile(samples, 0.95),
+        'max': max(samples),
+    }
+
+
+def time_method(obj, name, phase, frame_times):
+    method = getattr(obj, name)
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        result = method(*args, **kwargs)
+        frame_times[phase] += (time.perf_counter() - start) * 1000
+        return result
+
+    setattr(obj, name, timed)
+
+
+def scripted_keys(game, frame, state):
+    # Run back and forth across the level, jumping now and then
+    hero = game.world.hero
+
+    if hero.rect.right >= game.world_width:
+        state['direction'] = 'left'
+    elif hero.rect.left <= 0:
+        state['direction'] = 'right'
+
+    events = []
+    if frame % JUMP_INTERVAL == 0:
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=settings.CONTROLS['jump']))
+
+    return events, HeldKeys([settings.CONTROLS[state['direction']]])
+
+
+def run_benchmark(game, level, frames, render=True):
+    game.new_game()
+
+    start = time.perf_counter()
+    game.build_level(level)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    game.start_level()
+    game.hero.hearts = frames + 1  # at most one heart is lost per frame, so the hero outlives the run
+
+    frame_times = dict.fromkeys(PHASES, 0.0)
+    time_method(game.world, 'update', 'world.update', frame_times)
+    time_method(game.world, 'draw_background', 'world.draw', frame_times)
+    time_method(game.world, 'draw_sprites', 'world.draw', frame_times)
+
+    samples = {phase: [] for phase in PHASES + ['frame']}
+    state = {'direction': 'right'}
+
+    for frame in range(frames):
+        for phase in PHASES:
+            frame_times[phase] = 0.0
+
+        frame_start = time.perf_counter()
+
+        events, keys = scripted_keys(game, frame, state)
+        game.process_input(events, keys)
+        input_end = time.perf_counter()
+
+        game.update()
+        update_end = time.perf_counter()
+
+        if render:
+            game.render()
+        render_end = time.perf_counter()
+
+        frame_times['input'] = (input_end - frame_start) * 1000
+        frame_times['update'] = (update_end - input_end) * 1000
+        frame_times['render'] = (render_end - update_end) * 1000
+
+        for phase in PHASES:
+            samples[phase].append(frame_times[phase])
+        samples['frame'].append((render_end - frame_start) * 1000)
+
+    world = game.world
+
+    return {
+        'title': level['title'],
+        'width': level['width'],
+        'height': level['height'],
+        'frames': frames,
+        'sprites': len(world.all_sprites),
+        'platforms': len(world.platforms),
+        'water': len(world.water),
+        'enemies': len(world.enemies),
+        'items': len(world.items),
+        'terrain_chunks': world.terrain.chunk_count,
+        'load_ms': load_ms,
+        'asset_images': len(game.assets.images),
+        'asset_kb': game.assets.get_memory_usage() / 1024,
+        'phases': {phase: summarize(values) for phase, values in samples.items()},
+    }
+
+
+def print_report(result):
+    print(f"{result['title']}: {result['sprites']} sprites "
+          f"({result['platforms']} platforms, {result['water']} water, "
+          f"{result['enemies']} enemies, {result['items']} items)")
+    print(f"  load: {result['load_ms']:.1f} ms, {result['terrain_chunks']} terrain chunks baked at the end")
+    print(f"  assets: {result['asset_images']} images, {result['asset_kb']:.0f} KB")
+    print(f"  {'phase':<14}{'avg ms':>10}{'p95 ms':>10}{'max ms':>10}")
+
+    for phase, stats in result['phases'].items():
+        print(f"  {phase:<14}{stats['avg']:>10.3f}{stats['p95']:>10.3f}{stats['max']:>10.3f}")
+
+    print()
+
+
+def parse_size(text):
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def parse_density(text):
+    name, rate = text.split('=')
+    return name, float(rate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the game on synthetic levels.")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help="level sizes in tiles, e.g. 1000x16")
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-render', action='store_true', help="skip Game.render (simulation only)")
+    parser.add_argument('--density', nargs='+', default=[], help="override level densities, e.g. spikemen=0.5")
+    parser.add_argument('--batched-enemies', action='store_true', help="step enemies with NumPy (settings.BATCHED_ENEMIES)")
+    parser.add_argument('--streaming', action='store_true', help="stream entities around the camera (settings.LEVEL_STREAMING)")
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args()
+
+    settings.BATCHED_ENEMIES = args.batched_enemies
+    settings.LEVEL_STREAMING = args.streaming
+    densities = dict(parse_density(text) for text in args.density)
+
+    game = Game(headless=True)
+    results = []
+
+    for size in args.sizes:
+        width, height = parse_size(size)
+        level = generate_level(width, height, densities, seed=args.seed, goal=False)
+        result = run_benchmark(game, level, args.frames, render=not args.no_render)
+
+        print_report(result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Definition:
+Batch runner that plays every level headless, in parallel, and reports how each run went.
+
+Responsibilities:
+- Build one job per level and input source: scripted input (see SCRIPTS) on every level in
+  settings.LEVELS, plus any recorded sessions (see platformer.replay) from their own level
+- Run the jobs in a process pool, one headless Game per worker process, across all cores, with
+  next-level preloading off so every job's timings and state are its own
+- Record each run's outcome: goal reached, hearts lost, frames taken, avg and peak ms/frame,
+  and for replays whether the world state still matches the recording
+- Print a report and optionally write it as JSON
+
+Trigger / Usage:
+- Run from the repository root so asset paths resolve:
+    python -m benchmarks.verify_levels
+    python -m benchmarks.verify_levels --levels 1 2 3 --scripts run --frames 1800
+    python -m benchmarks.verify_levels --replays session.rec --workers 4 --json report.json
+"""
+
+# Standard Library Imports
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+from platformer.game import Game
+from platformer.replay import InputReplay
+from benchmarks.run import summarize
+
+
+JUMP_INTERVAL = 30  # frames between jumps for the 'run' script
+
+game = None  # one Game per worker process
+
+
+def press(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+def run_right(game, frame, rnd):
+    # Hold right and jump now and then
+    events = [press(settings.CONTROLS['jump'])] if frame % JUMP_INTERVAL == 0 else []
+    return events, [settings.CONTROLS['right']]
+
+
+def random_walk(game, frame, rnd):
+    # Mostly right, with random direction changes, climbing and jumps
+    held = [settings.CONTROLS[name] for name, chance in [('left', 0.3), ('right', 0.6), ('up', 0.2), ('down', 0.1)]
+            if rnd.random() < chance]
+    events = [press(settings.CONTROLS['jump'])] if rnd.random() < 0.05 else []
+    return events, held
+
+
+SCRIPTS = {
+    'run': run_right,
+    'random': random_walk,
+}
+
+
+def init_worker(render):
+    global game
+
+    # Jobs share this Game, so no preload thread may outlive one job and run into the next
+    settings.PRELOAD_NEXT_LEVEL = False
+    game = Game(headless=True, render=render)
+
+
+def play_frames(inputs, max_frames, replay=None):
+    # Step until the level ends, the input runs out or max_frames pass
+    samples = []
+    hearts_lost = 0
+    reached_goal = False
+
+    for frame in range(max_frames):
+        events, keys = next(inputs, (None, None))
+        if events is None:
+            break
+
+        if game.current_scene == Game.INTERACTING and replay is None:
+            events, keys = [press(settings.CONTROLS['dismiss'])], []
+
+        hearts = game.hero.hearts
+        start = time.perf_counter()
+        game.step(1, [(events, keys)])
+        samples.append((time.perf_counter() - start) * 1000)
+
+        hearts_lost += max(0, hearts - game.hero.hearts)
+        if replay is not None:
+            replay.check(game, frame)
+
+        if game.current_scene in [Game.LEVEL_COMPLETE, Game.WIN]:
+            reached_goal = True
+            if replay is None:
+                break
+        elif game.current_scene == Game.LOSE and replay is None:
+            break
+
+    stats = summarize(samples) if samples else {'avg': 0.0, 'p95': 0.0, 'max': 0.0}
+
+    return {
+        'reached_goal': reached_goal,
+        'hearts_lost': hearts_lost,
+        'frames': len(samples),
+        'final_scene': game.current_scene,
+        'avg_ms': stats['avg'],
+        'peak_ms': stats['max'],
+    }
+
+
+def run_job(job):
+    level, source, max_frames, seed = job
+
+    if source in SCRIPTS:
+        game.new_game()
+        game.level = level
+        game.load_level()
+        game.start_level()
+
+        rnd = random.Random(seed * 1000 + level)
+        script = SCRIPTS[source]
+        inputs = (script(game, frame, rnd) for frame in range(max_frames))
+
+        result = play_frames(inputs, max_frames)
+    else:
+        replay = InputReplay(source)
+        replay.start(game)
+        level = replay.level
+
+        result = play_frames(iter(replay), max_frames, replay)
+        result['mismatches'] = len(replay.mismatches)
+
+    result['level'] = level
+    result['source'] = source
+
+    return result
+
+
+def print_report(results):
+    print(f"{'level':<7}{'input':<24}{'goal':<6}{'hearts lost':>12}{'frames':>8}{'avg ms':>9}{'peak ms':>9}  notes")
+
+    for result in results:
+        notes = ""
+        if 'mismatches' in result and result['mismatches'] > 0:
+            notes = f"diverged from recording on {result['mismatches']} frames"
+
+        source = os.path.basename(result['source'])
+        goal = "yes" if result['reached_goal'] else "no"
+
+        print(f"{result['level']:<7}{source:<24}{goal:<6}{result['hearts_lost']:>12}{result['frames']:>8}"
+              f"{result['avg_ms']:>9.3f}{result['peak_ms']:>9.3f}  {notes}")
+
+    reached = sum(result['reached_goal'] for result in results)
+    print(f"\n{reached} of {len(results)} runs reached the goal")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play every level headless in parallel and report the outcomes.")
+    parser.add_argument('--levels', type=int, nargs='+', help="level numbers (default: all of settings.LEVELS)")
+    parser.add_argument('--scripts', nargs='*', default=list(SCRIPTS), choices=list(SCRIPTS))
+    parser.add_argument('--replays', nargs='*', default=[], help="recorded sessions to replay")
+    parser.add_argument('--frames', type=int, default=3600, help="most frames per run")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--render', action='store_true', help="also render each frame")
+    parser.add_argument('--json', help="also write the results to this file")
+    args = parser.parse_args()
+
+    levels = args.levels or range(1, len(settings.LEVELS) + 1)
+    jobs = [(level, script, args.frames, args.seed) for level in levels for script in args.scripts]
+    jobs += [(None, path, args.frames, args.seed) for path in args.replays]
+
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker, initargs=[args.render]) as pool:
+        results = list(pool.map(run_job, jobs))
+
+    print_report(results)
+    print(f"{len(jobs)} runs on {args.workers} workers in {time.perf_counter() - start:.1f} s")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if any(result.get('mismatches') for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+from .asset_manager import AssetManager
+from .text_cache import TextCache
+from .sound_bank import SoundBank
@@ -0,0 +1,51 @@
+"""
+Definition:
+A lazy, deduplicating cache for the images used by the game.
+
+Responsibilities:
+- Load and convert an image the first time its path is requested, never at startup
+- Share one surface per path, so repeated paths (e.g. animation frames) cost nothing extra
+- Cache derived variants (horizontally flipped, scaled) keyed by path and operation
+- Report how many surfaces are held and how much memory their pixels use
+
+Trigger / Usage:
+- Game owns a single AssetManager (game.assets).
+- World and Game request images and animation frame lists while building the hero and levels.
+"""
+
+# Standard Library Imports
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+
+
+class AssetManager:
+
+    def __init__(self):
+        self.images = {}  # (path, flip_x, size) -> Surface
+
+    def get_image(self, path, flip_x=False, size=None):
+        key = (path, flip_x, size)
+
+        if key not in self.images:
+            if size is not None:
+                image = pygame.transform.scale(self.get_image(path, flip_x), size)
+            elif flip_x:
+                image = pygame.transform.flip(self.get_image(path), True, False)
+            else:
+                image = pygame.image.load(path).convert_alpha()
+
+            self.images[key] = image
+
+        return self.images[key]
+
+    def get_animation(self, paths, flip_x=False, size=None):
+        return [self.get_image(path, flip_x, size) for path in paths]
+
+    def get_memory_usage(self):
+        return sum(image.get_pitch() * image.get_height() for image in self.images.values())
+
+    def clear(self):
+        self.images = {}
@@ -0,0 +1,87 @@
+"""
+Definition:
+A bank of preloaded sound effects, played from a fixed pool of reserved mixer channels.
+
+Responsibilities:
+- Load every effect in settings.SOUND_EFFECTS into a pygame.mixer.Sound once, when the game starts,
+  so playing one never touches the disk or decodes anything
+- Reserve a fixed set of channels for effects, so they never compete with sounds played elsewhere
+- Play each effect on a free channel, or take the channel of the oldest, least important effect
+  when all are busy (voice stealing); an effect is dropped if every channel plays something more
+  important
+- Do nothing when the mixer isn't available (e.g. no audio device)
+
+Trigger / Usage:
+- Game pre-initializes the mixer with settings.MIXER_* (small buffer for low latency) and owns a
+  single SoundBank (game.sounds).
+- Entities call game.sounds.play(name) when something happens, e.g. the hero jumping or a gem
+  being collected.
+"""
+
+# Standard Library Imports
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+
+
+class SoundBank:
+
+    def __init__(self, effects=settings.SOUND_EFFECTS, channels=settings.SOUND_CHANNELS):
+        self.enabled = pygame.mixer.get_init() is not None
+
+        self.sounds = {}  # name -> Sound
+        self.priorities = {}  # name -> priority, higher can take a channel from lower
+        self.channels = []
+        self.playing = []  # per channel: (priority, play count) of the last effect started on it
+        self.play_count = 0
+
+        if not self.enabled:
+            return
+
+        # Channels 0 to channels - 1 are kept for effects only
+        if pygame.mixer.get_num_channels() < channels:
+            pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(channels)
+
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.playing = [(0, 0)] * channels
+
+        for name, (path, priority) in effects.items():
+            self.sounds[name] = pygame.mixer.Sound(path)
+            self.priorities[name] = priority
+
+    def get_channel(self, priority):
+        # A free channel, else the oldest one playing the least important effect (None if all matter more)
+        stolen = None
+
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+
+            if self.playing[i][0] <= priority and (stolen is None or self.playing[i] < self.playing[stolen]):
+                stolen = i
+
+        return stolen
+
+    def play(self, name):
+        if not self.enabled:
+            return None
+
+        priority = self.priorities[name]
+        i = self.get_channel(priority)
+
+        if i is None:
+            return None
+
+        self.play_count += 1
+        self.playing[i] = (priority, self.play_count)
+        self.channels[i].play(self.sounds[name])
+
+        return self.channels[i]
+
+    def stop(self):
+        for channel in self.channels:
+            channel.stop()
@@ -0,0 +1,47 @@
+"""
+Definition:
+A bounded, least-recently-used cache of rendered text surfaces shared by all overlays.
+
+Responsibilities:
+- Render a piece of text the first time it's asked for with a given font, color and antialiasing
+- Hand back the same surface while the text stays the same, so static titles and unchanged
+  HUD values are never rendered twice
+- Evict the least recently used surfaces once the cache is full, so changing text (scores,
+  profiler numbers) can't grow it without bound
+
+Trigger / Usage:
+- Game owns a single TextCache (game.text_cache).
+- Overlays call render(font, text, antialias, color) in place of font.render(...).
+- Returned surfaces are shared, so they must only be blitted, never drawn on.
+"""
+
+# Standard Library Imports
+from collections import OrderedDict
+
+# Third-Party Imports
+
+# Local Imports
+import settings
+
+
+class TextCache:
+
+    def __init__(self, size=settings.TEXT_CACHE_SIZE):
+        self.size = size
+        self.surfaces = OrderedDict()  # (font, text, color, antialias) -> Surface, oldest first
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, tuple(color), antialias)
+
+        if key in self.surfaces:
+            self.surfaces.move_to_end(key)
+        else:
+            self.surfaces[key] = font.render(text, antialias, color)
+
+            if len(self.surfaces) > self.size:
+                self.surfaces.popitem(last=False)
+
+        return self.surfaces[key]
+
+    def clear(self):
+        self.surfaces.clear()
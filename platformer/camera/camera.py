@@ -6,11 +6,16 @@ is visible on screen.
 Responsibilities:
 - Calculate offset coordinates to render the world relative to a moving target (usually the player).
 - Support smooth following with adjustable lag.
+- Blend the focus of the last two updates, so frames drawn between simulation ticks scroll smoothly.
 - Optionally render debug visuals (target rect, focus crosshairs, screen midlines).
 
 Trigger / Usage:
 - Updated each frame during gameplay.
 - Offsets are applied when drawing world sprites to ensure correct screen positioning.
+- get_offsets(alpha) gives the offsets a fraction alpha of the way from the previous update to the
+  latest one (alpha defaults to 1, the latest update).
+- Offsets are whole pixels (rounded down), so a sub-pixel change of focus doesn't move the picture
+  and the last frame can be reused by scrolling it.
 - Can be toggled visible for debugging purposes.
 """
 
@@ -34,14 +39,24 @@ class ScrollingCamera:
 
         self.last_position = self.target.rect.center
         self.focus = self.last_position
+        self.previous_focus = self.focus
         self.visible = False
 
     def toggle(self):
         self.visible = not self.visible
 
-    def get_offsets(self):
+    def get_focus(self, alpha=1.0):
+        if alpha >= 1.0:
+            return self.focus
+
+        x0, y0 = self.previous_focus
+        x1, y1 = self.focus
+
+        return x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha
+
+    def get_offsets(self, alpha=1.0):
         #x, y = self.target.rect.center
-        x, y = self.focus
+        x, y = self.get_focus(alpha)
 
         screen_width = self.surface.get_width()
         screen_height = self.surface.get_height()
@@ -60,11 +75,11 @@ class ScrollingCamera:
         else:
             offset_y = y - screen_height // 2
         
-        return offset_x, offset_y
+        return math.floor(offset_x), math.floor(offset_y)
         
-    def draw(self, surface):
+    def draw(self, surface, alpha=1.0):
         if self.visible:
-            offset_x, offset_y = self.get_offsets()
+            offset_x, offset_y = self.get_offsets(alpha)
             screen_width = self.surface.get_width()
             screen_height = self.surface.get_height()
 
@@ -82,7 +97,7 @@ class ScrollingCamera:
             pygame.draw.rect(surface, pygame.Color('red'), offset_target_rect, 1)
 
             # Crosshairs at focus
-            x, y = self.focus
+            x, y = self.get_focus(alpha)
             x -= offset_x
             y -= offset_y
 
@@ -92,8 +107,11 @@ class ScrollingCamera:
     def snap_to_target(self):
         self.focus = self.target.rect.center
         self.last_position = self.focus
+        self.previous_focus = self.focus
 
     def update(self):
+        self.previous_focus = self.focus
+
         dx = self.target.rect.centerx - self.last_position[0]
         dy = self.target.rect.centery - self.last_position[1]
 
@@ -23,6 +23,8 @@ from platformer.entities.entity import Entity, AnimatedEntity
 
 class Cloud(AnimatedEntity):
 
+    always_active = True  # patrols the whole level
+
     def __init__(self, game, location, animations):
         super().__init__(game, location, animations)
 
@@ -12,9 +12,11 @@ Examples of subclasses:
 
 Responsibilities:
 - Track position and velocity
-- Handle collisions with platforms and world bounds
+- Handle collisions with platforms and world bounds (terrain is looked up in the world's tile map)
 - Apply gravity and movement logic
 - Provide a framework for animations (AnimatedEntity subclass)
+- Declare whether an entity keeps updating when it is far from the camera (always_active)
+- Declare the state a streamed level must remember for it while it is released (persistent)
 
 Trigger: None. These classes provide foundational behavior for derived objects.
 """
@@ -31,6 +33,9 @@ import settings
 # Base Entity Class
 class Entity(pygame.sprite.Sprite):
 
+    always_active = False  # True to keep updating outside the world's activation region
+    persistent = []  # Attributes kept when a streamed level releases the entity and creates it again
+
     def __init__(self, game, location, image):
         super().__init__()
 
@@ -42,6 +47,7 @@ class Entity(pygame.sprite.Sprite):
         self.vy = 0
 
         self.in_water = False
+        self.patrol_span = None  # (tile map revision, row, left, right) of the span last walked on
 
         if location is not None:
             self.move_to(location)
@@ -52,11 +58,8 @@ class Entity(pygame.sprite.Sprite):
 
     @property
     def on_platform(self):
-        self.rect.y += 1
-        hits = pygame.sprite.spritecollide(self, self.game.world.platforms, False)
-        self.rect.y -= 1
-
-        return len(hits) > 0
+        tilemap = self.game.world.tilemap
+        return tilemap.collideany(self.rect.move(0, 1), tilemap.SOLID)
 
     def apply_gravity(self):
         if self.in_water:
@@ -79,44 +82,60 @@ class Entity(pygame.sprite.Sprite):
         self.vx *= -1
 
     def check_water(self):
-        self.in_water = pygame.sprite.spritecollideany(self, self.game.world.water)
+        tilemap = self.game.world.tilemap
+        self.in_water = tilemap.collideany(self.rect, tilemap.WATER)
     
     def check_platforms_x(self):
-        hits = pygame.sprite.spritecollide(self, self.game.world.platforms, False)
+        tilemap = self.game.world.tilemap
+        hits = tilemap.collide(self.rect, tilemap.SOLID)
 
         for platform in hits:
             if self.vx > 0:
-                self.rect.right = platform.rect.left
+                self.rect.right = platform.left
             elif self.vx < 0:
-                self.rect.left = platform.rect.right
+                self.rect.left = platform.right
 
         return len(hits) > 0
 
     def check_platforms_y(self):
-        hits = pygame.sprite.spritecollide(self, self.game.world.platforms, False)
+        tilemap = self.game.world.tilemap
+        hits = tilemap.collide(self.rect, tilemap.SOLID)
 
         for platform in hits:
             if self.vy > 0:
-                self.rect.bottom = platform.rect.top
+                self.rect.bottom = platform.top
             elif self.vy < 0:
-                self.rect.top = platform.rect.bottom
+                self.rect.top = platform.bottom
 
         if len(hits) > 0:
             self.vy = 0
 
     def check_platform_edges(self):
+        tilemap = self.game.world.tilemap
+
+        if self.vx != 0 and self.rect.bottom % tilemap.tile_size == 0:
+            # Standing on a row of cells, so compare the leading edge with the span underfoot
+            row = self.rect.bottom // tilemap.tile_size
+            lead_x = self.rect.left if self.vx < 0 else self.rect.right - 1
+            span = self.patrol_span
+
+            if span is None or span[:2] != (tilemap.revision, row) or not span[2] <= lead_x < span[3]:
+                bounds = tilemap.get_span(lead_x // tilemap.tile_size, row)
+                span = (tilemap.revision, row) + bounds if bounds is not None else None
+                self.patrol_span = span
+
+            return span is None
+
         at_edge = True
 
-        self.rect.y +=  1
-        hits = pygame.sprite.spritecollide(self, self.game.world.platforms, False)
-        self.rect.y -= 1
+        hits = tilemap.collide(self.rect.move(0, 1), tilemap.SOLID)
 
         for platform in hits:
             if self.vx < 0:
-                if platform.rect.left <= self.rect.left:
+                if platform.left <= self.rect.left:
                     at_edge = False
             elif self.vx > 0:
-                if platform.rect.right >= self.rect.right:
+                if platform.right >= self.rect.right:
                     at_edge = False
 
         return at_edge
@@ -11,6 +11,8 @@ Examples:
 Trigger:
 - Responds to player input each frame.
 - Collision and overlap checks occur automatically in update().
+- What the hero is touching (ground, water, climbables, goal, interactables) is worked out
+  once per position and cached in a ContactState until the hero's rect or world changes.
 """
 
 # Standard Library Imports
@@ -23,8 +25,33 @@ import settings
 from platformer.entities.entity import AnimatedEntity
 
 
+class ContactState:
+
+    def __init__(self, hero):
+        world = hero.game.world
+        tilemap = world.tilemap
+
+        self.world = world
+        self.rect = hero.rect.copy()
+
+        self.grounded = tilemap.collideany(hero.rect.move(0, 1), tilemap.SOLID)
+        self.in_water = tilemap.collideany(hero.rect, tilemap.WATER)
+        self.climbables = world.spatial_hash.collide(hero, world.climbables)
+        self.touching_goal = world.spatial_hash.collideany(hero, world.goals)
+        self.interactables = world.spatial_hash.collide(hero, world.interactables)
+
+    @property
+    def on_climbable(self):
+        return len(self.climbables) > 0
+
+    def is_current(self, hero):
+        return self.rect == hero.rect and self.world is hero.game.world
+
+
 class Hero(AnimatedEntity):
 
+    always_active = True
+
     def __init__(self, game, location, animations, controls):
         super().__init__(game, location, animations, default_animation_key="idle_right") 
 
@@ -38,6 +65,7 @@ class Hero(AnimatedEntity):
         self.respawn_point = location  # actually gets set in load level, location is None at instantiation (should this just be saved in game?)
         self.key_chain = []
         self.is_climbing = False
+        self.contact_state = None
     
     def act(self, events, pressed_keys):
         if pressed_keys[self.controls['left']]:
@@ -61,6 +89,17 @@ class Hero(AnimatedEntity):
                 elif event.key == settings.CONTROLS['interact']:
                     self.check_interactables()
 
+    @property
+    def contacts(self):
+        if self.contact_state is None or not self.contact_state.is_current(self):
+            self.contact_state = ContactState(self)
+
+        return self.contact_state
+
+    @property
+    def on_platform(self):
+        return self.contacts.grounded
+
     @property
     def can_jump(self):
         return self.on_platform or self.is_climbing or self.in_water
@@ -68,7 +107,7 @@ class Hero(AnimatedEntity):
     @property
     def can_climb(self):
         # Could check that hero is somewhat centered on ladder
-        on_climbable = pygame.sprite.spritecollideany(self, self.game.world.climbables)
+        on_climbable = self.contacts.on_climbable
         if not on_climbable:
             self.is_climbing = False
         return on_climbable
@@ -79,7 +118,7 @@ class Hero(AnimatedEntity):
 
     @property
     def reached_goal(self):
-        return pygame.sprite.spritecollideany(self, self.game.world.goals)  # No collision resolution here, let hero overlap flag
+        return self.contacts.touching_goal  # No collision resolution here, let hero overlap flag
         
     def go_left(self):
         if self.in_water:
@@ -106,7 +145,7 @@ class Hero(AnimatedEntity):
         if self.can_climb:
             self.is_climbing = True
         
-        hits = pygame.sprite.spritecollide(self, self.game.world.climbables, False)
+        hits = self.contacts.climbables
         can_go_up_more = False
         for climbable in hits:
             if climbable.rect.top < self.rect.centery:
@@ -138,15 +177,19 @@ class Hero(AnimatedEntity):
 
             self.vy = jump_power
             self.is_climbing = False
+            self.game.sounds.play('jump')
 
     def check_interactables(self):
-        hits = pygame.sprite.spritecollide(self, self.game.world.interactables, False)
+        hits = self.contacts.interactables
 
         for interactable in hits:
             interactable.interact(self)
 
+    def check_water(self):
+        self.in_water = self.contacts.in_water
+
     def check_enemies(self):
-        hits = pygame.sprite.spritecollide(self, self.game.world.enemies, False)
+        hits = self.game.world.spatial_hash.collide(self, self.game.world.enemies)
 
         if self.escape_time == 0:
             for enemy in hits:
@@ -167,7 +210,7 @@ class Hero(AnimatedEntity):
             self.escape_time -= 1
     
     def check_items(self):
-        hits = pygame.sprite.spritecollide(self, self.game.world.items, True)
+        hits = self.game.world.spatial_hash.collide(self, self.game.world.items, True)
     
         for item in hits:
             item.apply(self)
@@ -24,6 +24,8 @@ from platformer.overlays import SignText, SpeechBubble
 
 class Door(Entity):
 
+    persistent = ['unlocked']  # the key is used up, so a streamed door must stay unlocked
+
     def __init__(self, game, location, image, destination, code=None):
         super().__init__(game, location, image)
 
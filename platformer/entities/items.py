@@ -29,6 +29,7 @@ class Gem(Entity):
 
     def apply(self, character):
         self.game.score += settings.GEM_VALUE
+        self.game.sounds.play('gem')
 
 
 class Heart(Entity):
@@ -42,6 +42,7 @@ class ItemBlock(Platform):
         if not self.used:
             self.used = True
             self.game.world.items.add(self.item)
+            self.game.world.spatial_hash.add(self.item, self.game.world.items)
 
 
 class MovingPlatform(Platform):
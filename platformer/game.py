@@ -4,32 +4,62 @@ The central game controller that manages scenes, input, updates, rendering, and
 overall game flow.
 
 Responsibilities:
-- Initialize Pygame, load assets, and create necessary overlays (HUD, grid, menus)
+- Initialize Pygame, create the asset and text caches, the sound bank and necessary overlays
+  (HUD, grid, menus)
 - Track current scene (start, playing, interacting, pause, level complete, win, lose)
 - Manage level loading, hero creation, and world instantiation
+- Build the next level on a worker thread while the level complete screen is showing
 - Handle player input and interactions with the world
 - Update the world state and camera position
 - Render the world, HUD, overlays, and infoboxes
-- Maintain game loop with consistent framerate
+- Optionally update only the changed regions of the display while the camera is stationary
+- Optionally keep the last frame's background while the camera scrolls, shifting it by the camera
+  movement and drawing only the newly exposed edges (just the terrain when the level has parallax
+  layers, which are drawn under it every time the camera moves)
+- Draw the world once when it stops (menus, pauses, dialogs) and reuse that picture, optionally
+  darkened or blurred, until play resumes
+- Step the simulation at a fixed tick rate, decoupled from how often frames are drawn, with a
+  cap on how many ticks can run to catch up after a slow frame
+- Draw sprites and camera interpolated between the last two ticks
+- Optionally run headless (dummy SDL drivers, no display updates) and step frames uncapped
+- Time each phase of the frame for the profiler overlay
+- Optionally record the input and world state of every tick, for replaying the session later
 
 Trigger: The main game loop is executed via Game.play(), which continuously
-processes input, updates game state, and renders each frame.
+processes input, updates game state in fixed ticks, and renders each frame. Headless games are
+usually driven with Game.step(n_frames, inputs) instead, e.g. for soak tests or
+automated level checks on machines without a display.
 """
 
 # Standard library
-import json
+import os
+import threading
+import time
 
 # Third-party
 import pygame
 
 # Local
 import settings
+from platformer.assets import AssetManager, SoundBank, TextCache
 from platformer.camera import ScrollingCamera
 from platformer.world import World
-from platformer.overlays import TitleScreen, WinScreen, LoseScreen, LevelCompleteScreen, PauseScreen, HUD, Grid
+from platformer.world.level_file import load_level
+from platformer.overlays import TitleScreen, WinScreen, LoseScreen, LevelCompleteScreen, PauseScreen, HUD, Grid, Profiler
+from platformer.replay import InputRecorder
 from platformer.entities import Hero
 
 
+# Stand-in for pygame.key.get_pressed() when input is scripted
+class HeldKeys:
+
+    def __init__(self, keys=()):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
 # Main game class 
 class Game:
 
@@ -42,80 +72,56 @@ class Game:
     WIN = 5
     LOSE = 6
 
-    def __init__(self):
-        pygame.mixer.pre_init()
+    # Scenes where the world doesn't update, so it can be drawn once and reused
+    FROZEN_SCENES = [START, INTERACTING, PAUSE, LEVEL_COMPLETE, WIN, LOSE]
+
+    def __init__(self, headless=False, render=True):
+        self.headless = headless
+        self.render_enabled = render  # headless games can skip drawing entirely
+
+        if self.headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        pygame.mixer.pre_init(settings.MIXER_FREQUENCY, settings.MIXER_SIZE, settings.MIXER_CHANNELS, settings.MIXER_BUFFER)
         pygame.init()
 
         self.screen = pygame.display.set_mode([settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT])
         pygame.display.set_caption(settings.CAPTION)
         self.clock = pygame.time.Clock()
         self.running = True
-
-        self.load_assets()
+        self.frame = 0
+
+        # Next level, built in the background during LEVEL_COMPLETE
+        self.preload_thread = None
+        self.preloaded = None  # (generation, level number, World)
+        self.preload_generation = 0  # bumped to drop whatever is being preloaded
+
+        # Dirty-rect rendering
+        self.dirty_rect_rendering = settings.DIRTY_RECT_RENDERING
+        self.scroll_reuse_rendering = settings.SCROLL_REUSE_RENDERING
+        self.background = pygame.Surface(self.screen.get_size())
+        self.terrain_layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)  # terrain alone, over parallax layers
+        self.background_key = None
+        self.previous_rects = []
+        self.dirty_rects = None  # None means the whole display needs updating
+        self.overlays_drawn = False  # whether a debug overlay was drawn over the last frame
+
+        # Picture of the world while it's frozen
+        self.snapshot = pygame.Surface(self.screen.get_size())
+        self.snapshot_key = None
+
+        self.assets = AssetManager()
+        self.text_cache = TextCache()
+        self.sounds = SoundBank()
         self.make_overlays()
         self.new_game()
 
-    def load_assets(self):
-        # Platforms
-        self.grass_dirt_img = pygame.image.load(settings.GRASS_DIRT_IMG).convert_alpha()
-        self.dirt_img = pygame.image.load(settings.DIRT_IMG).convert_alpha()
-        self.block_img = pygame.image.load(settings.BLOCK_IMG).convert_alpha()
-        
-        # Hero
-        self.hero_animations = {
-            "idle_right": [pygame.image.load(path).convert_alpha() for path in settings.HERO_IMGS_IDLE],
-            "walk_right": [pygame.image.load(path).convert_alpha() for path in settings.HERO_IMGS_WALK],
-            "jump_right": [pygame.image.load(path).convert_alpha() for path in settings.HERO_IMGS_JUMP],
-            "climb": [pygame.image.load(path).convert_alpha() for path in settings.HERO_IMGS_CLIMB],
-        }
-        self.hero_animations["idle_left"] = [pygame.transform.flip(image, True, False) for image in self.hero_animations["idle_right"]]
-        self.hero_animations["walk_left"] = [pygame.transform.flip(image, True, False) for image in self.hero_animations["walk_right"]]
-        self.hero_animations["jump_left"] = [pygame.transform.flip(image, True, False) for image in self.hero_animations["jump_right"]]
-
-        # Enemies
-        self.cloud_animations = {
-            "default": [pygame.image.load(path).convert_alpha() for path in settings.CLOUD_IMGS]
-        }
-
-        self.spikeball_animations = {
-            "default": [pygame.image.load(path).convert_alpha() for path in settings.SPIKEBALL_IMGS]
-        }
-
-        self.spikeman_animations = {
-            "walk_right": [pygame.image.load(path).convert_alpha() for path in settings.SPIKEMAN_IMGS]
-        }
-        self.spikeman_animations["walk_left"] = [pygame.transform.flip(image, True, False) for image in self.spikeman_animations["walk_right"]]
-        
-        self.fish_animations = {
-            "swim_left": [pygame.image.load(path).convert_alpha() for path in settings.FISH_IMGS]
-        }
-        self.fish_animations["swim_right"] = [pygame.transform.flip(image, True, False) for image in self.fish_animations["swim_left"]]
-        
-        # Items
-        self.gem_img = pygame.image.load(settings.GEM_IMG).convert_alpha()
-        self.heart_img = pygame.image.load(settings.HEART_IMG).convert_alpha()
-        self.key_img = pygame.image.load(settings.KEY_IMG).convert_alpha()
-
-        # Interactables
-        self.door_img = pygame.image.load(settings.DOOR_IMG).convert_alpha()
-        self.locked_door_img = pygame.image.load(settings.LOCKED_DOOR_IMG).convert_alpha()
-        self.sign_img = pygame.image.load(settings.SIGN_IMG).convert_alpha()
-        self.shopkeeper_img = pygame.image.load(settings.SHOPKEEPER_IMG).convert_alpha()
-        self.wizard_img = pygame.image.load(settings.WIZARD_IMG).convert_alpha()
- 
-        # Climbables
-        self.ladder_img = pygame.image.load(settings.LADDER_IMG).convert_alpha()
-        self.ladder_top_img = pygame.image.load(settings.LADDER_TOP_IMG).convert_alpha()
-
-        # fluids
-        self.water_img = pygame.image.load(settings.WATER_IMG).convert_alpha()
-        self.water_top_img = pygame.image.load(settings.WATER_TOP_IMG).convert_alpha()
-
-        # Goal
-        self.flag_animations = {
-            "default": [pygame.image.load(path).convert_alpha() for path in settings.FLAG_IMGS]
-        }
-        self.flagpole_img = pygame.image.load(settings.FLAGPOLE_IMG).convert_alpha()
+        # Input recording, started from the freshly created game
+        if settings.RECORD_INPUT_FILE is not None:
+            self.recorder = InputRecorder(self)
+        else:
+            self.recorder = None
 
     def make_overlays(self):
         self.scene_overlays = {
@@ -128,9 +134,22 @@ class Game:
 
         self.hud = HUD(self)
         self.grid = Grid(self)
+        self.profiler = Profiler(self)
         
     def new_game(self):
-        self.hero = Hero(self, None, self.hero_animations, settings.CONTROLS)
+        self.discard_preloaded_world()
+
+        hero_animations = {
+            "idle_right": self.assets.get_animation(settings.HERO_IMGS_IDLE),
+            "walk_right": self.assets.get_animation(settings.HERO_IMGS_WALK),
+            "jump_right": self.assets.get_animation(settings.HERO_IMGS_JUMP),
+            "idle_left": self.assets.get_animation(settings.HERO_IMGS_IDLE, flip_x=True),
+            "walk_left": self.assets.get_animation(settings.HERO_IMGS_WALK, flip_x=True),
+            "jump_left": self.assets.get_animation(settings.HERO_IMGS_JUMP, flip_x=True),
+            "climb": self.assets.get_animation(settings.HERO_IMGS_CLIMB),
+        }
+
+        self.hero = Hero(self, None, hero_animations, settings.CONTROLS)
         self.current_scene = Game.START
         self.level = settings.STARTING_LEVEL
         self.score = 0
@@ -139,11 +158,16 @@ class Game:
     def load_level(self):
         # Load the level data
         current_level_file = settings.LEVELS[self.level - 1]
-        with open(current_level_file) as f: 
-            level_data = json.load(f)
+        level_data = load_level(current_level_file)  # compiled binary copy, rebuilt if the JSON is newer
+
+        self.build_level(level_data)
 
+    def build_level(self, level_data):
+        self.set_world(World(self, level_data))
+
+    def set_world(self, world):
         # World settings
-        self.world = World(self, level_data)
+        self.world = world
         self.world_width = self.world.world_width
         self.world_height = self.world.world_height
         self.camera = ScrollingCamera(self.screen, [self.world_width, self.world_height], self.hero, settings.CAMERA_LAG)
@@ -163,9 +187,52 @@ class Game:
     def complete_level(self):
         self.current_scene = Game.LEVEL_COMPLETE
 
+        if settings.PRELOAD_NEXT_LEVEL and self.level < len(settings.LEVELS):
+            self.preload_level(self.level + 1)
+
+    def preload_level(self, level):
+        self.discard_preloaded_world()
+        self.preload_thread = threading.Thread(target=self.build_preloaded_world,
+                                               args=[level, self.preload_generation], daemon=True)
+        self.preload_thread.start()
+
+    def build_preloaded_world(self, level, generation):
+        level_data = load_level(settings.LEVELS[level - 1])
+        world = World(self, level_data, preload=True)
+
+        # Dropped if it was discarded while it was being built
+        if generation == self.preload_generation:
+            self.preloaded = (generation, level, world)
+
+    def discard_preloaded_world(self):
+        # A worker still building finds its generation is stale and drops its world
+        self.preload_generation += 1
+        self.preloaded = None
+
+    def take_preloaded_world(self, level):
+        # Only use the preloaded world if it's finished, otherwise don't wait for it
+        preloaded = self.preloaded
+        generation = self.preload_generation
+        self.discard_preloaded_world()  # used or not, it isn't needed any more
+
+        if self.preload_thread is None or self.preload_thread.is_alive():
+            return None
+        if preloaded is None or preloaded[0] != generation or preloaded[1] != level:
+            return None
+
+        return preloaded[2]
+
     def advance(self):
+        self.hero.kill()  # leave the finished level's groups, so it can be freed
         self.level += 1
-        self.load_level()
+        world = self.take_preloaded_world(self.level)
+
+        if world is not None:
+            world.place_hero()
+            self.set_world(world)
+        else:
+            self.load_level()
+
         self.start_level()
 
     def win(self):
@@ -202,11 +269,18 @@ class Game:
         self.infobox = None
         self.current_scene = Game.PLAYING
 
-    def process_input(self):
-        pressed_keys = pygame.key.get_pressed()
+    def process_input(self, events=None, pressed_keys=None):
+        if events is None:
+            events = pygame.event.get()
+        if pressed_keys is None:
+            pressed_keys = pygame.key.get_pressed()
+
+        if self.recorder is not None:
+            self.recorder.record_input(events, pressed_keys)
+
         filtered_events = []
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 self.quit()
 
@@ -216,6 +290,8 @@ class Game:
                     self.grid.toggle()
                 elif event.key == pygame.K_c:
                     self.camera.toggle()
+                elif event.key == pygame.K_f:
+                    self.profiler.toggle()
 
                 # start/restart/pause
                 if self.current_scene == Game.START:
@@ -245,30 +321,254 @@ class Game:
     def update(self):
         if self.current_scene == Game.PLAYING:
             self.world.update()
+        else:
+            self.world.previous_positions.clear()  # nothing moved, so nothing to interpolate
 
         self.check_status()
-        self.camera.update()
 
-    def render(self):
-        offset_x, offset_y = self.camera.get_offsets()
-        self.world.draw(self.screen, offset_x, offset_y)
-        self.hud.draw(self.screen)
+        # A frozen scene shows the world where the camera stopped, so it waits for play to resume
+        if self.current_scene not in Game.FROZEN_SCENES:
+            self.camera.update()
+
+        if self.recorder is not None:
+            self.recorder.record_state(self)
+
+    def get_exposed_strips(self, dx, dy):
+        # Parts of the background left empty by scrolling it by (dx, dy)
+        width, height = self.background.get_size()
+        strips = []
+
+        if dx > 0:
+            strips.append(pygame.Rect(0, 0, dx, height))
+        elif dx < 0:
+            strips.append(pygame.Rect(width + dx, 0, -dx, height))
+
+        if dy > 0:
+            strips.append(pygame.Rect(0, 0, width, dy))
+        elif dy < 0:
+            strips.append(pygame.Rect(0, height + dy, width, -dy))
+
+        return strips
+
+    def draw_terrain_layer(self, surface, offset_x, offset_y):
+        surface.fill((0, 0, 0, 0))
+        self.world.terrain.draw(surface, offset_x, offset_y)
+
+    def update_layer(self, layer, previous_key, key, draw):
+        # Shift what's on the layer by the camera movement and draw the edges, or draw all of it
+        width, height = layer.get_size()
+        offset_x, offset_y = key[2:]
+
+        if self.scroll_reuse_rendering and previous_key is not None and previous_key[:2] == key[:2]:
+            dx = previous_key[2] - offset_x
+            dy = previous_key[3] - offset_y
+
+            if abs(dx) < width and abs(dy) < height:
+                # Only the camera moved, so shift what's there and fill in the edges
+                layer.scroll(dx, dy)
+
+                for strip in self.get_exposed_strips(dx, dy):
+                    layer.set_clip(strip)
+                    draw(layer, offset_x, offset_y)
+
+                layer.set_clip(None)
+                return
+
+        # Level or terrain changed (or the camera jumped), so everything gets redrawn
+        draw(layer, offset_x, offset_y)
+
+    def update_background(self, offset_x, offset_y):
+        # Bring the cached background to the camera offsets, returns whether it changed
+        key = (self.world, self.world.terrain.revision, offset_x, offset_y)
+        previous_key = self.background_key
+
+        if key == previous_key:
+            return False
+
+        self.background_key = key
+        parallax = self.world.background
+
+        if parallax.plain:
+            # The sky looks the same wherever the camera is, so the whole background is shifted
+            self.update_layer(self.background, previous_key, key, self.world.draw_background)
+        else:
+            # Parallax layers move at their own speed, so only the terrain is shifted and they go under it
+            self.update_layer(self.terrain_layer, previous_key, key, self.draw_terrain_layer)
+            parallax.draw(self.background, offset_x, offset_y)
+            self.background.blit(self.terrain_layer, [0, 0])
+
+        return True
+
+    def get_overlays_on(self):
+        return self.grid.on or self.camera.visible or self.profiler.on
+
+    def restore_background(self, offset_x, offset_y):
+        changed = self.update_background(offset_x, offset_y)
+
+        # Debug overlays change every frame, and the one after they're turned off still shows them
+        overlays = self.overlays_drawn or self.get_overlays_on()
+
+        if changed or overlays or not self.dirty_rect_rendering:
+            self.screen.blit(self.background, [0, 0])
+            self.dirty_rects = None
+        else:
+            # Erase last frame's sprites and text
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+            self.dirty_rects = list(self.previous_rects)
+
+    def take_snapshot(self, offset_x, offset_y, alpha):
+        self.world.draw(self.snapshot, offset_x, offset_y, alpha)
+
+        if settings.FREEZE_FRAME_BLUR > 0:
+            self.snapshot = pygame.transform.box_blur(self.snapshot, settings.FREEZE_FRAME_BLUR)
+
+        if settings.FREEZE_FRAME_DIM > 0:
+            shade = pygame.Surface(self.snapshot.get_size())
+            shade.set_alpha(settings.FREEZE_FRAME_DIM)
+            self.snapshot.blit(shade, [0, 0])
+
+    def restore_snapshot(self, offset_x, offset_y, alpha):
+        key = (self.current_scene, self.world)
+
+        if key != self.snapshot_key:
+            # World just stopped, so draw it once and keep it until the scene changes
+            self.take_snapshot(offset_x, offset_y, alpha)
+            self.snapshot_key = key
+            self.background_key = None  # the screen no longer matches the cached background
+            self.screen.blit(self.snapshot, [0, 0])
+            self.dirty_rects = None
+        elif not self.dirty_rect_rendering or self.overlays_drawn or self.get_overlays_on():
+            self.screen.blit(self.snapshot, [0, 0])
+            self.dirty_rects = None
+        else:
+            # Erase last frame's text
+            for rect in self.previous_rects:
+                self.screen.blit(self.snapshot, rect, rect)
+            self.dirty_rects = list(self.previous_rects)
+
+    def render(self, alpha=1.0):
+        # alpha is how far between the last two ticks to draw, 1 draws the latest tick
+        offset_x, offset_y = self.camera.get_offsets(alpha)
+
+        if self.current_scene in Game.FROZEN_SCENES:
+            self.restore_snapshot(offset_x, offset_y, alpha)
+            rects = []
+        else:
+            self.snapshot_key = None
+
+            if self.dirty_rect_rendering or self.scroll_reuse_rendering:
+                self.restore_background(offset_x, offset_y)
+            else:
+                self.world.draw_background(self.screen, offset_x, offset_y)
+                self.dirty_rects = None
+
+            rects = self.world.draw_sprites(self.screen, offset_x, offset_y, alpha)
+
+        rects += self.hud.draw(self.screen)
 
         if self.infobox is not None:
-            self.infobox.draw(self.screen)
+            rects += self.infobox.draw(self.screen)
         elif self.current_scene != Game.PLAYING:
-            self.scene_overlays[self.current_scene].draw(self.screen)
+            rects += self.scene_overlays[self.current_scene].draw(self.screen)
 
         self.grid.draw(self.screen, offset_x, offset_y)
-        self.camera.draw(self.screen)
+        self.camera.draw(self.screen, alpha)
+        self.profiler.draw(self.screen)
+        self.overlays_drawn = self.get_overlays_on()
+
+        if self.dirty_rects is not None:
+            self.dirty_rects += rects
+        self.previous_rects = rects
         
+    def step(self, n_frames=1, inputs=None):
+        # inputs yields one (events, held keys) pair per frame, frames past its end get no input
+        inputs = iter(inputs) if inputs is not None else iter(())
+        frames = 0
+
+        while self.running and frames < n_frames:
+            events, keys = next(inputs, ([], ()))
+
+            if not isinstance(keys, (HeldKeys, pygame.key.ScancodeWrapper)):
+                keys = HeldKeys(keys)
+
+            frame_start = time.perf_counter()
+
+            self.process_input(list(events), keys)
+            start = self.profiler.record('input', frame_start)
+            self.update()
+            start = self.profiler.record('update', start)
+
+            if self.render_enabled:
+                self.render()
+                self.profiler.record('render', start)
+
+            self.profiler.record('frame', frame_start)
+            self.profiler.end_frame()
+            self.frame += 1
+            frames += 1
+
+        return frames
+
     def play(self):
+        tick_time = 1 / settings.TICK_RATE
+        accumulator = 0.0
+        events = []
+        last_time = time.perf_counter()
+
         while self.running:
-            self.process_input()     
-            self.update()     
-            self.render()
-            
-            pygame.display.update()
-            self.clock.tick(settings.FPS)
+            frame_start = time.perf_counter()
+
+            if self.headless:
+                accumulator = tick_time  # one tick per frame, as fast as possible
+            else:
+                accumulator += frame_start - last_time
+            last_time = frame_start
+
+            # Events wait for the next tick, so none are lost on frames without one
+            events += pygame.event.get()
+            start = self.profiler.record('input', frame_start)
+
+            ticks = 0
+            while self.running and accumulator >= tick_time and ticks < settings.MAX_CATCH_UP_TICKS:
+                self.process_input(events)
+                events = []
+                self.update()
+                accumulator -= tick_time
+                ticks += 1
+
+            # Too far behind to catch up, so drop the backlog and run slow for a moment
+            if accumulator >= tick_time:
+                accumulator %= tick_time
+
+            start = self.profiler.record('update', start)
+
+            if self.render_enabled:
+                if settings.INTERPOLATE_RENDERING and not self.headless:
+                    self.render(accumulator / tick_time)
+                else:
+                    self.render()
+                start = self.profiler.record('render', start)
+
+            if not self.headless:
+                if self.dirty_rects is None:
+                    pygame.display.update()
+                else:
+                    pygame.display.update(self.dirty_rects)
+                start = self.profiler.record('display', start)
+                self.clock.tick(settings.FPS)
+            else:
+                self.clock.tick()  # uncapped
+
+            self.profiler.record('tick', start)
+            self.profiler.record('frame', frame_start)
+            self.profiler.end_frame()
+            self.frame += 1
+
+        if self.profiler.dump_file is not None:
+            self.profiler.dump(self.profiler.dump_file)
+
+        if self.recorder is not None:
+            self.recorder.save(settings.RECORD_INPUT_FILE)
 
         pygame.quit()
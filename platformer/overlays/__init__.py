@@ -1,4 +1,5 @@
 from .scenes import TitleScreen, PauseScreen, LevelCompleteScreen, LoseScreen, WinScreen
 from .grid import Grid
 from .hud import HUD
-from .infoboxes import SignText, SpeechBubble
\ No newline at end of file
+from .infoboxes import SignText, SpeechBubble
+from .profiler import Profiler
@@ -6,6 +6,9 @@ Responsibilities:
 - Draw vertical and horizontal grid lines based on the game's GRID_SIZE.
 - Optionally display coordinates of each grid cell.
 - Adjust lines dynamically based on camera offsets for accurate positioning.
+- Pre-render the lines and labels for the visible cells once, and only redraw them when the
+  camera scrolls into a new row or column of cells. Then the image is shifted and only the cells
+  that scrolled into view are drawn, with labels from the game's text cache.
 
 Trigger / Usage:
 - Can be toggled on/off.
@@ -33,29 +36,67 @@ class Grid:
         self.color = color
         self.font = pygame.font.Font(None, 16)
 
+        # Pre-rendered lines and labels
+        self.image = None
+        self.image_key = None  # (first column, first row, screen width, screen height)
+
     def toggle(self):
         self.on = not self.on
 
+    def draw_cells(self, first_col, first_row, cells):
+        # Lines along the left and top edges of each (i, j) cell of the image, and its label
+        size = settings.GRID_SIZE
+
+        for i, j in cells:
+            x = i * size
+            y = j * size
+
+            pygame.draw.line(self.image, self.color, [x, y], [x, y + size], 1)
+            pygame.draw.line(self.image, self.color, [x, y], [x + size, y], 1)
+
+            point = f'({first_col + i}, {first_row + j})'
+            text = self.game.text_cache.render(self.font, point, True, self.color)
+            self.image.blit(text, [x + 4, y + 4])
+
+    def render(self, first_col, first_row, width, height):
+        size = settings.GRID_SIZE
+        cols = len(range(0, width + size, size))
+        rows = len(range(0, height + size, size))
+
+        previous_key = self.image_key
+        cells = [(i, j) for i in range(cols) for j in range(rows)]
+
+        if self.image is not None and previous_key[2:] == (width, height):
+            dcol = first_col - previous_key[0]
+            drow = first_row - previous_key[1]
+
+            if abs(dcol) < cols and abs(drow) < rows:
+                # Shift what's there and draw only the cells that scrolled into view
+                self.image.scroll(-dcol * size, -drow * size)
+
+                kept_cols = range(max(0, -dcol), min(cols, cols - dcol))
+                kept_rows = range(max(0, -drow), min(rows, rows - drow))
+                cells = [(i, j) for i, j in cells if i not in kept_cols or j not in kept_rows]
+
+                for i, j in cells:
+                    self.image.fill((0, 0, 0, 0), [i * size, j * size, size, size])
+
+                self.draw_cells(first_col, first_row, cells)
+                return
+
+        self.image = pygame.Surface([cols * size, rows * size], pygame.SRCALPHA)
+        self.draw_cells(first_col, first_row, cells)
+
     def draw(self, surface, offset_x=0, offset_y=0):
         if self.on:
-            width = surface.get_width()
-            height = surface.get_height()
-            
-            for x in range(0, width + settings.GRID_SIZE, settings.GRID_SIZE):
-                adj_x = x - offset_x % settings.GRID_SIZE
-                pygame.draw.line(surface, self.color, [adj_x, 0], [adj_x, height], 1)
-
-            for y in range(0, height + settings.GRID_SIZE, settings.GRID_SIZE):
-                adj_y = y - offset_y % settings.GRID_SIZE
-                pygame.draw.line(surface, self.color, [0, adj_y], [width, adj_y], 1)
-
-            for x in range(0, width + settings.GRID_SIZE, settings.GRID_SIZE):
-                for y in range(0, height + settings.GRID_SIZE, settings.GRID_SIZE):
-                    adj_x = x - offset_x % settings.GRID_SIZE + 4
-                    adj_y = y - offset_y % settings.GRID_SIZE + 4
-                    disp_x = x // settings.GRID_SIZE + offset_x // settings.GRID_SIZE
-                    disp_y = y // settings.GRID_SIZE + offset_y // settings.GRID_SIZE
-                    
-                    point = f'({disp_x}, {disp_y})'
-                    text = self.font.render(point, True, self.color)
-                    surface.blit(text, [adj_x, adj_y])
+            size = settings.GRID_SIZE
+            first_col = int(offset_x // size)
+            first_row = int(offset_y // size)
+
+            # Only redraw when a new row or column of cells scrolls into view
+            key = (first_col, first_row, surface.get_width(), surface.get_height())
+            if key != self.image_key:
+                self.render(*key)
+                self.image_key = key
+
+            surface.blit(self.image, [first_col * size - offset_x, first_row * size - offset_y])
@@ -5,7 +5,8 @@ Heads-up display (HUD) overlay showing vital player and game information.
 Responsibilities:
 - Render player stats such as level, score, and hearts.
 - Optionally update or animate HUD elements if needed (currently a placeholder update method).
-- Draws directly to the game surface each frame.
+- Draws directly to the game surface each frame, reusing text from the game's text cache
+  so a value is only re-rendered when it changes.
 
 Trigger / Usage:
 - Called each frame from Game.render() after the world has been drawn.
@@ -34,17 +35,21 @@ class HUD:
         pass
 
     def draw(self, surface):
-        text = self.primary_font.render(f"Level: {self.game.level}", True, settings.WHITE)
+        rects = []
+
+        text = self.game.text_cache.render(self.primary_font, f"Level: {self.game.level}", True, settings.WHITE)
         rect = text.get_rect()
         rect.topleft = 16, 16
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
 
-        text = self.primary_font.render(f"Score: {self.game.score}", True, settings.WHITE)
+        text = self.game.text_cache.render(self.primary_font, f"Score: {self.game.score}", True, settings.WHITE)
         rect = text.get_rect()
         rect.topleft = 16, 56
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
 
-        text = self.primary_font.render(f"Hearts: {self.game.world.hero.hearts}", True, settings.WHITE)
+        text = self.game.text_cache.render(self.primary_font, f"Hearts: {self.game.world.hero.hearts}", True, settings.WHITE)
         rect = text.get_rect()
         rect.topleft = 16, 96
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
+
+        return rects
@@ -114,10 +114,12 @@ class InfoBox:
         y = self.rect.y + self.padding
         
         for line in self.lines:
-            text_surf = self.font.render(line, True, self.text_color)
+            text_surf = self.game.text_cache.render(self.font, line, True, self.text_color)
             surface.blit(text_surf, (x, y))
             y += text_surf.get_height() + self.line_spacing
 
+        return [self.rect]
+
 
 class SignText(InfoBox):
     def __init__(self, game, text):
@@ -0,0 +1,125 @@
+"""
+Definition:
+A lightweight frame profiler with an on-screen overlay showing where each frame's time goes.
+
+Responsibilities:
+- Time each phase of the game loop (input, update, render, display update, clock tick)
+- Time World.update per entity class while profiling is enabled (overlay visible or a dump file set)
+- Keep the most recent samples of every phase in a fixed-size ring buffer
+- Show avg/p95/p99 milliseconds for each phase when toggled on
+- Dump the buffered samples and their summaries to a JSON file
+
+Trigger / Usage:
+- Game records the loop phases every frame and calls end_frame() once each frame is done.
+- Can be toggled on/off, next to the grid and camera debug overlays.
+- Game dumps the buffer on exit when settings.PROFILER_DUMP_FILE is set, so headless and soak runs
+  get the per-class times too.
+"""
+
+# Standard Library Imports
+import json
+import time
+from collections import deque
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+
+
+class Profiler:
+
+    def __init__(self, game, size=settings.PROFILER_BUFFER_SIZE, dump_file=settings.PROFILER_DUMP_FILE,
+                 color=settings.WHITE):
+        self.game = game
+        self.on = False
+        self.size = size
+        self.dump_file = dump_file
+
+        self.samples = {}       # phase -> deque of ms
+        self.entity_times = {}  # entity class name -> ms spent in update() this frame
+
+        self.color = color
+        self.font = pygame.font.Font(None, 20)
+
+    def toggle(self):
+        self.on = not self.on
+
+    def get_enabled(self):
+        # Per-class timing costs a little every update, so it only runs when someone will see it
+        return self.on or self.dump_file is not None
+
+    def add_sample(self, phase, ms):
+        if phase not in self.samples:
+            self.samples[phase] = deque(maxlen=self.size)
+
+        self.samples[phase].append(ms)
+
+    def record(self, phase, start):
+        now = time.perf_counter()
+        self.add_sample(phase, (now - start) * 1000)
+
+        return now
+
+    def update_entity(self, sprite):
+        start = time.perf_counter()
+        sprite.update()
+
+        name = type(sprite).__name__
+        self.entity_times[name] = self.entity_times.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def end_frame(self):
+        for name, ms in self.entity_times.items():
+            self.add_sample(f"update:{name}", ms)
+
+        self.entity_times.clear()
+
+    def get_stats(self, phase):
+        ordered = sorted(self.samples[phase])
+        last = len(ordered) - 1
+
+        return {
+            'avg': sum(ordered) / len(ordered),
+            'p95': ordered[int(last * 0.95)],
+            'p99': ordered[int(last * 0.99)],
+        }
+
+    def dump(self, path):
+        data = {}
+
+        for phase, samples in self.samples.items():
+            data[phase] = self.get_stats(phase)
+            data[phase]['samples'] = list(samples)
+
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+    def draw(self, surface):
+        if self.on:
+            rows = [["phase (ms)", "avg", "p95", "p99"]]
+
+            for phase in self.samples:
+                stats = self.get_stats(phase)
+                rows.append([phase, f"{stats['avg']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}"])
+
+            name_width = 160
+            number_width = 56
+            line_height = self.font.get_linesize()
+
+            box = pygame.Rect(0, 0, name_width + 3 * number_width + 16, len(rows) * line_height + 16)
+            box.topright = surface.get_width() - 8, 8
+            pygame.draw.rect(surface, settings.BLACK, box)
+
+            y = box.top + 8
+            for row in rows:
+                text = self.game.text_cache.render(self.font, row[0], True, self.color)
+                surface.blit(text, [box.left + 8, y])
+
+                for i, cell in enumerate(row[1:]):
+                    text = self.game.text_cache.render(self.font, cell, True, self.color)
+                    rect = text.get_rect()
+                    rect.topright = box.left + 8 + name_width + (i + 1) * number_width, y
+                    surface.blit(text, rect)
+
+                y += line_height
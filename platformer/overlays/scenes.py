@@ -9,6 +9,7 @@ Responsibilities:
     - Level completion
     - Pause state
 - Provide minimal update logic; primarily visual.
+- Text comes from the game's text cache, so static titles are rendered once.
 - Drawn on top of the game surface when the game is in a corresponding scene.
 
 Trigger / Usage:
@@ -38,17 +39,21 @@ class TitleScreen:
         pass
 
     def draw(self, surface):
-        text = self.title_font.render(settings.CAPTION, True, settings.WHITE)
+        rects = []
+
+        text = self.game.text_cache.render(self.title_font, settings.CAPTION, True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.bottom = settings.SCREEN_HEIGHT // 2 - 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
     
-        text = self.subtitle_font.render("Press 'SPACE' to start.", True, settings.WHITE)
+        text = self.game.text_cache.render(self.subtitle_font, "Press 'SPACE' to start.", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.top = settings.SCREEN_HEIGHT // 2 + 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
+
+        return rects
 
 
 class WinScreen:
@@ -63,17 +68,21 @@ class WinScreen:
         pass
 
     def draw(self, surface):
-        text = self.title_font.render("You win!", True, settings.WHITE)
+        rects = []
+
+        text = self.game.text_cache.render(self.title_font, "You win!", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.bottom = settings.SCREEN_HEIGHT // 2 - 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
     
-        text = self.subtitle_font.render("Press 'r' to play again or 'q' to quit.", True, settings.WHITE)
+        text = self.game.text_cache.render(self.subtitle_font, "Press 'r' to play again or 'q' to quit.", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.top = settings.SCREEN_HEIGHT // 2 + 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
+
+        return rects
 
 
 class LoseScreen:
@@ -88,17 +97,21 @@ class LoseScreen:
         pass
 
     def draw(self, surface):
-        text = self.title_font.render("You lose!", True, settings.WHITE)
+        rects = []
+
+        text = self.game.text_cache.render(self.title_font, "You lose!", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.bottom = settings.SCREEN_HEIGHT // 2 - 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
     
-        text = self.subtitle_font.render("Press 'r' to play again or 'q' to quit.", True, settings.WHITE)
+        text = self.game.text_cache.render(self.subtitle_font, "Press 'r' to play again or 'q' to quit.", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.top = settings.SCREEN_HEIGHT // 2 + 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
+
+        return rects
 
 
 class LevelCompleteScreen:
@@ -112,11 +125,15 @@ class LevelCompleteScreen:
         pass
 
     def draw(self, surface):
-        text = self.title_font.render("Level Complete!", True, settings.WHITE)
+        rects = []
+
+        text = self.game.text_cache.render(self.title_font, "Level Complete!", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.bottom = settings.SCREEN_HEIGHT // 2 - 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
+
+        return rects
 
 
 class PauseScreen:
@@ -131,14 +148,18 @@ class PauseScreen:
         pass
 
     def draw(self, surface):
-        text = self.subtitle_font.render("Paused", True, settings.WHITE)
+        rects = []
+
+        text = self.game.text_cache.render(self.subtitle_font, "Paused", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.bottom = settings.SCREEN_HEIGHT // 2 - 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
     
-        text = self.subtitle_font.render("Press 'p' to continue", True, settings.WHITE)
+        text = self.game.text_cache.render(self.subtitle_font, "Press 'p' to continue", True, settings.WHITE)
         rect = text.get_rect()
         rect.centerx = settings.SCREEN_WIDTH // 2
         rect.top = settings.SCREEN_HEIGHT // 2 + 8
-        surface.blit(text, rect)
+        rects.append(surface.blit(text, rect))
+
+        return rects
@@ -0,0 +1 @@
+from .replay import InputRecorder, InputReplay, get_state_hash
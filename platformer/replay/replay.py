@@ -0,0 +1,131 @@
+"""
+Definition:
+Deterministic recording and replay of the input a game receives, one entry per simulation tick.
+
+Responsibilities:
+- Record the keys pressed down (KEYDOWN events) and the held control keys that
+  Game.process_input() receives each tick
+- Record a hash of the world state after each tick (scene, level, score, hero and enemy
+  positions, items left) so a replay can prove it reproduced the session exactly
+- Save recordings as small gzip-compressed JSON files
+- Feed a recording back into a game tick by tick, e.g. through Game.step(), and check the
+  world state against the recorded hashes
+
+Trigger / Usage:
+- Game records every session to settings.RECORD_INPUT_FILE when it is set, and saves on exit.
+- Replay a recording headless and uncapped with:
+    python -m benchmarks.replay session.rec
+- In code:
+    replay = InputReplay('session.rec')
+    replay.start(game)
+    for frame, inputs in enumerate(replay):
+        game.step(1, [inputs])
+        replay.check(game, frame)
+"""
+
+# Standard Library Imports
+import gzip
+import json
+import zlib
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+
+
+FORMAT_VERSION = 1
+
+
+def get_state_hash(game):
+    world = game.world
+    hero = world.hero
+
+    state = (
+        game.current_scene, game.level, game.score, hero.hearts,
+        tuple(hero.rect), hero.vx, hero.vy,
+        [tuple(enemy.rect) for enemy in world.enemies],
+        len(world.items),
+    )
+
+    return zlib.crc32(repr(state).encode())
+
+
+class InputRecorder:
+
+    def __init__(self, game, keys=None):
+        self.level = game.level
+        self.keys = list(keys) if keys is not None else sorted(set(settings.CONTROLS.values()))
+
+        self.frames = []  # [held key bitmask, [keys pressed this tick]]
+        self.hashes = []
+
+    def record_input(self, events, pressed_keys):
+        mask = 0
+        for i, key in enumerate(self.keys):
+            if pressed_keys[key]:
+                mask |= 1 << i
+
+        pressed = [event.key for event in events if event.type == pygame.KEYDOWN]
+        self.frames.append([mask, pressed])
+
+    def record_state(self, game):
+        self.hashes.append(get_state_hash(game))
+
+    def save(self, path):
+        data = {
+            'version': FORMAT_VERSION,
+            'level': self.level,
+            'keys': self.keys,
+            'frames': self.frames,
+            'hashes': self.hashes,
+        }
+
+        with gzip.open(path, 'wt') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+
+class InputReplay:
+
+    def __init__(self, path):
+        with gzip.open(path, 'rt') as f:
+            data = json.load(f)
+
+        if data['version'] != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported recording version {data['version']}")
+
+        self.level = data['level']
+        self.keys = data['keys']
+        self.frames = data['frames']
+        self.hashes = data['hashes']
+
+        self.mismatches = []  # frames whose world state differed from the recording
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __iter__(self):
+        # (events, held keys) per tick, the input format of Game.step()
+        for mask, pressed in self.frames:
+            events = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in pressed]
+            held = [key for i, key in enumerate(self.keys) if mask & (1 << i)]
+
+            yield events, held
+
+    def start(self, game):
+        # Put the game back where the recording started
+        game.new_game()
+
+        if game.level != self.level:
+            game.level = self.level
+            game.load_level()
+
+        self.mismatches = []
+
+    def check(self, game, frame):
+        if frame < len(self.hashes) and get_state_hash(game) != self.hashes[frame]:
+            self.mismatches.append(frame)
+            return False
+
+        return True
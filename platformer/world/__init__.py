@@ -1 +1,7 @@
-from .world import World
\ No newline at end of file
+from .world import World
+from .spatial_hash import SpatialHash
+from .terrain import TerrainLayer
+from .enemy_engine import EnemyEngine
+from .tilemap import TileMap
+from .streaming import LevelStreamer
+from .parallax import ParallaxBackground, ParallaxLayer
@@ -0,0 +1,249 @@
+"""
+Definition:
+An optional batched physics engine that advances all simple enemies at once with NumPy arrays.
+
+Responsibilities:
+- Store position, size, velocity and behavior flags of every Cloud, Fish, Spikeball and Spikeman
+  in parallel arrays (struct-of-arrays) instead of stepping each sprite in Python
+- Reproduce the per-sprite update() of each enemy type with vectorized steps: water check,
+  gravity (apply_gravity), movement, platform collision, ledge turning, world edge clamping
+  (check_world_edges), falling off the world and turning around
+- Resolve terrain collision against the solid and water cells of the world's tile map, rebuilding
+  its copies of them whenever the map changes
+- Write results back to sprite rects, velocities and animations only for enemies near the
+  camera, so off-screen enemies cost nothing in Python
+- Kill enemies that fall off the bottom of the world
+
+Trigger / Usage:
+- World creates an EnemyEngine when settings.BATCHED_ENEMIES is on and NumPy is installed
+  (EnemyEngine.supported), and calls update() every frame instead of updating those enemies.
+- Enemies of other classes (including subclasses) keep their normal update().
+"""
+
+# Standard Library Imports
+
+# Third-Party Imports
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Local Imports
+import settings
+from platformer.entities.enemies import Cloud, Fish, Spikeball, Spikeman
+
+
+FAR = 2 ** 62  # stands in for "no platform" when looking for the nearest one
+
+# (gravity and water, platforms in x, platforms in y, turn at ledges, die off bottom)
+BEHAVIORS = {
+    Cloud: (False, False, False, False, False),
+    Fish: (False, True, False, False, False),
+    Spikeball: (True, True, True, False, True),
+    Spikeman: (True, True, True, True, True),
+}
+
+
+class EnemyEngine:
+
+    supported = np is not None
+
+    def __init__(self, world):
+        self.world = world
+        self.size = settings.GRID_SIZE
+
+        self.sprites = [sprite for sprite in world.enemies if type(sprite) in BEHAVIORS]
+        self.members = {sprite: i for i, sprite in enumerate(self.sprites)}
+
+        rects = [sprite.rect for sprite in self.sprites]
+        flags = np.array([BEHAVIORS[type(sprite)] for sprite in self.sprites], dtype=bool).reshape(-1, 5)
+
+        self.x = np.array([rect.x for rect in rects], dtype=np.int64)
+        self.y = np.array([rect.y for rect in rects], dtype=np.int64)
+        self.w = np.array([rect.width for rect in rects], dtype=np.int64)
+        self.h = np.array([rect.height for rect in rects], dtype=np.int64)
+        self.vx = np.array([sprite.vx for sprite in self.sprites], dtype=np.float64)
+        self.vy = np.array([sprite.vy for sprite in self.sprites], dtype=np.float64)
+        self.in_water = np.zeros(len(self.sprites), dtype=bool)
+
+        self.falls, self.blocks_x, self.blocks_y, self.ledges, self.dies = flags.T.copy()
+
+        self.cols = world.tilemap.cols
+        self.rows = world.tilemap.rows
+        self.grid_revision = None
+        self.update_grids()
+
+    def update_grids(self):
+        # Terrain can change after the level is built (TileMap.add/remove), so follow the map's revision
+        tilemap = self.world.tilemap
+
+        if self.grid_revision != tilemap.revision:
+            self.solid = self.make_grid(tilemap.SOLID)
+            self.water = self.make_grid(tilemap.WATER)
+            self.grid_revision = tilemap.revision
+
+    def make_grid(self, flag):
+        # Row by row like the tile map, with one extra empty cell for lookups outside the world
+        flags = np.frombuffer(self.world.tilemap.flags, dtype=np.uint8)
+        return np.append(flags & flag != 0, False)
+
+    def get_hits(self, grid, x, y):
+        # One (mask, col, row) per cell offset an enemy can overlap
+        size = self.size
+        c0, c1 = x // size, (x + self.w - 1) // size
+        r0, r1 = y // size, (y + self.h - 1) // size
+
+        outside = self.rows * self.cols
+        span_x = int((c1 - c0).max(initial=0)) + 1
+        span_y = int((r1 - r0).max(initial=0)) + 1
+        hits = []
+
+        for dc in range(span_x):
+            col = c0 + dc
+            col_valid = (col <= c1) & (col >= 0) & (col < self.cols)
+
+            for dr in range(span_y):
+                row = r0 + dr
+                valid = col_valid & (row <= r1) & (row >= 0) & (row < self.rows)
+                index = np.where(valid, row * self.cols + col, outside)
+                hits.append((grid[index], col, row))
+
+        return hits
+
+    def check_water(self):
+        in_water = np.zeros(len(self.x), dtype=bool)
+
+        for mask, col, row in self.get_hits(self.water, self.x, self.y):
+            in_water |= mask
+
+        self.in_water = in_water & self.falls
+
+    def apply_gravity(self):
+        gravity = np.where(self.in_water, settings.WATER_GRAVITY, settings.GRAVITY)
+        terminal_velocity = np.where(self.in_water, settings.WATER_TERMINAL_VELOCITY, settings.TERMINAL_VELOCITY)
+
+        self.vy = np.where(self.falls, np.minimum(self.vy + gravity, terminal_velocity), self.vy)
+
+    def check_platforms_x(self):
+        size = self.size
+        hit = np.zeros(len(self.x), dtype=bool)
+        nearest_left = np.full(len(self.x), FAR)
+        nearest_right = np.full(len(self.x), -FAR)
+
+        for mask, col, row in self.get_hits(self.solid, self.x, self.y):
+            mask = mask & self.blocks_x
+            hit |= mask
+            nearest_left = np.where(mask, np.minimum(nearest_left, col * size), nearest_left)
+            nearest_right = np.where(mask, np.maximum(nearest_right, (col + 1) * size), nearest_right)
+
+        self.x = np.where(hit & (self.vx > 0), nearest_left - self.w, self.x)
+        self.x = np.where(hit & (self.vx < 0), nearest_right, self.x)
+
+        return hit
+
+    def check_platforms_y(self):
+        size = self.size
+        hit = np.zeros(len(self.y), dtype=bool)
+        nearest_top = np.full(len(self.y), FAR)
+        nearest_bottom = np.full(len(self.y), -FAR)
+
+        for mask, col, row in self.get_hits(self.solid, self.x, self.y):
+            mask = mask & self.blocks_y
+            hit |= mask
+            nearest_top = np.where(mask, np.minimum(nearest_top, row * size), nearest_top)
+            nearest_bottom = np.where(mask, np.maximum(nearest_bottom, (row + 1) * size), nearest_bottom)
+
+        self.y = np.where(hit & (self.vy > 0), nearest_top - self.h, self.y)
+        self.y = np.where(hit & (self.vy < 0), nearest_bottom, self.y)
+        self.vy = np.where(hit, 0.0, self.vy)
+
+    def check_platform_edges(self):
+        # Same test as Entity.check_platform_edges: ground under the leading edge, one pixel down
+        size = self.size
+        supported = np.zeros(len(self.x), dtype=bool)
+        lead_col = np.where(self.vx < 0, self.x // size, (self.x + self.w - 1) // size)
+
+        for mask, col, row in self.get_hits(self.solid, self.x, self.y + 1):
+            supported |= mask & (col == lead_col) & (self.vx != 0)
+
+        return self.ledges & ~supported
+
+    def check_world_edges(self):
+        world_width = self.world.world_width
+
+        past_left = self.x < 0
+        past_right = ~past_left & (self.x + self.w > world_width)
+
+        self.x = np.where(past_left, 0, self.x)
+        self.x = np.where(past_right, world_width - self.w, self.x)
+
+        return past_left | past_right
+
+    def update(self):
+        if len(self.sprites) == 0:
+            return
+
+        self.update_grids()
+        self.check_water()
+        self.apply_gravity()
+
+        self.x = np.trunc(self.x + self.vx).astype(np.int64)
+        hit_platform_x = self.check_platforms_x()
+        self.y = np.trunc(self.y + self.vy).astype(np.int64)
+        self.check_platforms_y()
+        at_platform_edge = self.check_platform_edges()
+        at_world_edge = self.check_world_edges()
+        off_bottom_edge = self.dies & (self.y > self.world.world_height)
+
+        turn = at_world_edge | hit_platform_x | at_platform_edge
+        self.vx = np.where(turn, -self.vx, self.vx)
+
+        self.write_back()
+
+        if off_bottom_edge.any():
+            self.remove(off_bottom_edge)
+
+    def get_nearby(self):
+        # Enemies inside the activation region, plus any whose stale rect is still in it
+        if settings.ACTIVATION_MARGIN is None:
+            return np.arange(len(self.sprites))
+
+        region = self.world.get_active_region()
+        inside = ((self.x < region.right) & (self.x + self.w > region.left) &
+                  (self.y < region.bottom) & (self.y + self.h > region.top))
+        nearby = set(np.flatnonzero(inside).tolist())
+
+        for sprite in self.world.spatial_hash.collide_rect(region, self.world.enemies):
+            if sprite in self.members:
+                nearby.add(self.members[sprite])
+
+        return sorted(nearby)
+
+    def write_back(self):
+        written = []
+
+        for i in self.get_nearby():
+            sprite = self.sprites[i]
+            self.world.previous_positions[sprite] = sprite.rect.topleft
+            sprite.rect.x = int(self.x[i])
+            sprite.rect.y = int(self.y[i])
+            sprite.vx = self.vx[i].item()
+            sprite.vy = self.vy[i].item()
+            sprite.in_water = bool(self.in_water[i])
+            sprite.animate()
+            written.append(sprite)
+
+        self.world.spatial_hash.update(written)
+
+    def remove(self, dead):
+        for i in np.flatnonzero(dead):
+            sprite = self.sprites[i]
+            sprite.kill()
+            self.world.spatial_hash.discard(sprite)
+
+        keep = ~dead
+        self.sprites = [sprite for sprite, alive in zip(self.sprites, keep) if alive]
+        self.members = {sprite: i for i, sprite in enumerate(self.sprites)}
+
+        for name in ['x', 'y', 'w', 'h', 'vx', 'vy', 'in_water', 'falls', 'blocks_x', 'blocks_y', 'ledges', 'dies']:
+            setattr(self, name, getattr(self, name)[keep])
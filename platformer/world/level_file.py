@@ -0,0 +1,210 @@
+"""
+Definition:
+Compiler and loader for a compact binary level format, built from the JSON level files.
+
+Responsibilities:
+- Compile a level's JSON into a binary file: a header (size, start), one typed int32 array
+  of (x, y) cells per tile category (grass_dirt, water, gems, ...) and a small JSON table
+  for keyed objects (doors, signs, npcs, keys) and anything else that isn't a list of cells
+- Load compiled levels through a read-only memory map, so cell arrays are never parsed
+- Recompile automatically when the JSON file is newer than its compiled copy, or the
+  compiled copy is from an older format version or is empty or cut short
+- Fall back to plain JSON if the compiled copy can't be written or read
+
+Trigger / Usage:
+- Game.load_level() calls load_level(path) with the path of a JSON level file.
+- The result behaves like the parsed JSON for World: 'key' in data, data['key'] and
+  iterating a tile category (which yields (x, y) tuples) all work the same.
+- Compile every level ahead of time with:
+    python -m platformer.world.level_file
+"""
+
+# Standard Library Imports
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+# Third-Party Imports
+
+# Local Imports
+import settings
+
+
+MAGIC = b'PLVL'
+VERSION = 1
+EXTENSION = '.lvl'
+
+HEADER = struct.Struct('<4sHiiiiII')  # magic, version, width, height, start x, start y, category count, table length
+CATEGORY = struct.Struct('<II')        # cell count, byte offset of the cells
+
+
+class TileArray:
+
+    def __init__(self, values):
+        self.values = values  # flat int32 sequence: x0, y0, x1, y1, ...
+
+    def __len__(self):
+        return len(self.values) // 2
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+
+        return (self.values[2 * index], self.values[2 * index + 1])
+
+    def __iter__(self):
+        values = iter(self.values)
+        return zip(values, values)
+
+
+def get_binary_path(json_path):
+    return os.path.splitext(json_path)[0] + EXTENSION
+
+
+def is_tile_list(value):
+    return isinstance(value, list) and all(isinstance(cell, list) and len(cell) == 2 and
+                                           all(isinstance(n, int) for n in cell) for cell in value)
+
+
+def compile_level(json_path, binary_path=None):
+    if binary_path is None:
+        binary_path = get_binary_path(json_path)
+
+    with open(json_path) as f:
+        data = json.load(f)
+
+    categories = {}
+    table = {}
+
+    for key, value in data.items():
+        if key in ['width', 'height', 'start']:
+            continue
+        elif is_tile_list(value):
+            categories[key] = value
+        else:
+            table[key] = value
+
+    names = [name.encode('utf-8') for name in categories]
+    table_bytes = json.dumps(table).encode('utf-8')
+
+    # Header, category entries and table, padded so the cell arrays are 4-byte aligned
+    size = HEADER.size + sum(1 + len(name) + CATEGORY.size for name in names) + len(table_bytes)
+    offset = size + (-size % 4)
+
+    start_x, start_y = data['start']
+    out = bytearray(HEADER.pack(MAGIC, VERSION, data['width'], data['height'], start_x, start_y, len(names), len(table_bytes)))
+
+    for name, cells in zip(names, categories.values()):
+        out += bytes([len(name)]) + name + CATEGORY.pack(len(cells), offset)
+        offset += len(cells) * 8
+
+    out += table_bytes
+    out += bytes(-len(out) % 4)
+
+    for cells in categories.values():
+        out += struct.pack(f'<{len(cells) * 2}i', *[n for cell in cells for n in cell])
+
+    # Write then rename, so a half-written file is never read. The temp file is unique, so threads
+    # and processes compiling the same level at once don't write over each other
+    directory, name = os.path.split(binary_path)
+    fd, temp_path = tempfile.mkstemp(prefix=f"{name}.", suffix='.tmp', dir=directory or '.')
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(out)
+        os.replace(temp_path, binary_path)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def read_level(binary_path):
+    # None when the file is from another format version or cut short, so it gets compiled again
+    with open(binary_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            return None
+
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, width, height, start_x, start_y, count, table_length = HEADER.unpack_from(buffer, 0)
+
+    if magic != MAGIC or version != VERSION:
+        return None
+
+    data = {'width': width, 'height': height, 'start': [start_x, start_y]}
+    view = memoryview(buffer)
+    size = len(buffer)
+    position = HEADER.size
+
+    for _ in range(count):
+        if position >= size:
+            return None
+
+        length = buffer[position]
+        if position + 1 + length + CATEGORY.size > size:
+            return None
+
+        name = bytes(buffer[position + 1:position + 1 + length]).decode('utf-8')
+        position += 1 + length
+
+        cells, offset = CATEGORY.unpack_from(buffer, position)
+        position += CATEGORY.size
+
+        if offset + cells * 8 > size:
+            return None
+
+        values = view[offset:offset + cells * 8]
+        if sys.byteorder == 'little':
+            values = values.cast('i')
+        else:
+            values = array('i', values)
+            values.byteswap()
+
+        data[name] = TileArray(values)
+
+    if position + table_length > size:
+        return None
+
+    try:
+        data.update(json.loads(bytes(buffer[position:position + table_length])))
+    except ValueError:
+        return None
+
+    return data
+
+
+def load_level(json_path):
+    binary_path = get_binary_path(json_path)
+
+    try:
+        if not os.path.exists(binary_path) or os.path.getmtime(json_path) > os.path.getmtime(binary_path):
+            compile_level(json_path, binary_path)
+
+        data = read_level(binary_path)
+
+        if data is None:  # compiled by an older version, or cut short
+            compile_level(json_path, binary_path)
+            data = read_level(binary_path)
+
+        if data is not None:
+            return data
+
+    except OSError:
+        pass
+
+    with open(json_path) as f:
+        return json.load(f)
+
+
+def main():
+    for path in settings.LEVELS:
+        compile_level(path)
+        print(f"{path} -> {get_binary_path(path)}")
+
+
+if __name__ == "__main__":
+    main()
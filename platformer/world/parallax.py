@@ -0,0 +1,86 @@
+"""
+Definition:
+A parallax background made of image layers that scroll slower (or faster) than the world.
+
+Responsibilities:
+- Scale each layer image to the screen height and convert it to the display format once, when
+  the level is built (the bottom layer is flattened onto the sky color, so it is opaque)
+- Tile each layer into a cached strip at least one screen wider than the image, so any camera
+  position is drawn with a single blit per layer
+- Move each layer sideways by the camera offset times its scroll factor (0 stays put, 1 moves
+  with the world)
+- Fill the sky color when a level has no layers
+
+Trigger / Usage:
+- World builds a ParallaxBackground in make_level() from the level's "background" list, or from
+  settings.BACKGROUND_LAYERS when the level doesn't have one. Layers go back to front:
+    "background": [
+        {"image": "assets/images/backgrounds/final_day.png", "scroll": 0.25}
+    ]
+  An empty list gives the plain sky color.
+- World.draw_background() calls draw(surface, offset_x, offset_y) before drawing the terrain.
+- Layers don't move vertically. Game.update_background() shifts the previous frame along with
+  the camera only for a plain background; with layers it shifts the terrain alone and draws the
+  layers under it.
+"""
+
+# Standard Library Imports
+import math
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+
+
+class ParallaxLayer:
+
+    def __init__(self, image, scroll, opaque=False):
+        self.scroll = scroll
+        self.width = image.get_width()
+
+        # Copies side by side, so every screen-wide window of the strip is in one piece
+        copies = math.ceil(settings.SCREEN_WIDTH / self.width) + 1
+        size = (self.width * copies, image.get_height())
+
+        if opaque:
+            self.strip = pygame.Surface(size).convert()
+            self.strip.fill(settings.SKY_BLUE)
+        else:
+            self.strip = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+
+        for i in range(copies):
+            self.strip.blit(image, [i * self.width, 0])
+
+    def draw(self, surface, offset_x):
+        x = math.floor(offset_x * self.scroll) % self.width
+        area = pygame.Rect(x, 0, surface.get_width(), self.strip.get_height())
+
+        surface.blit(self.strip, [0, 0], area)
+
+
+class ParallaxBackground:
+
+    def __init__(self, assets, layers):
+        self.layers = []
+
+        for i, layer in enumerate(layers):
+            image = assets.get_image(layer['image'])
+            width, height = image.get_size()
+
+            if height != settings.SCREEN_HEIGHT:
+                scale = settings.SCREEN_HEIGHT / height
+                image = assets.get_image(layer['image'], size=(round(width * scale), settings.SCREEN_HEIGHT))
+
+            scroll = layer['scroll'] if 'scroll' in layer else 1.0
+            self.layers.append(ParallaxLayer(image, scroll, opaque=(i == 0)))
+
+        self.plain = not self.layers  # just the sky color, which looks the same wherever the camera is
+
+    def draw(self, surface, offset_x=0, offset_y=0):
+        if not self.layers:
+            surface.fill(settings.SKY_BLUE)
+
+        for layer in self.layers:
+            layer.draw(surface, offset_x)
@@ -0,0 +1,173 @@
+"""
+Definition:
+A uniform-grid spatial hash that buckets sprites by the grid cells their rects overlap.
+
+Responsibilities:
+- Index the sprites of each registered group into cells of a fixed size (GRID_SIZE by default)
+- Answer collision queries by testing only the sprites in the cells a rect touches
+- Re-bucket moving sprites incrementally, only when the cells they overlap change
+- Forget sprites that have been killed or removed from their group
+- Return hits in group insertion order so results match pygame.sprite.spritecollide()
+
+Trigger / Usage:
+- World registers each of its sprite groups after the level is built.
+- World calls update() every frame to refresh the groups registered as dynamic, optionally
+  limited to the sprites that were actually updated.
+- Entities call collide() and collideany() in place of the pygame.sprite helpers.
+"""
+
+# Standard Library Imports
+
+# Third-Party Imports
+
+# Local Imports
+import settings
+
+
+class SpatialHash:
+
+    def __init__(self, cell_size=settings.GRID_SIZE):
+        self.cell_size = cell_size
+
+        self.buckets = {}    # group -> {cell: set of sprites}
+        self.locations = {}  # group -> {sprite: (cells, rank)}
+        self.dynamic_groups = []
+        self.next_rank = 0
+
+    def register(self, group, dynamic=False):
+        self.buckets[group] = {}
+        self.locations[group] = {}
+
+        if dynamic:
+            self.dynamic_groups.append(group)
+
+        for sprite in group:
+            self.add(sprite, group)
+
+    def get_cell_range(self, rect):
+        size = self.cell_size
+
+        left = rect.left // size
+        top = rect.top // size
+        right = max(left, (rect.right - 1) // size)
+        bottom = max(top, (rect.bottom - 1) // size)
+
+        return left, top, right, bottom
+
+    def get_cells(self, rect):
+        left, top, right, bottom = self.get_cell_range(rect)
+
+        return tuple((x, y) for x in range(left, right + 1) for y in range(top, bottom + 1))
+
+    def add(self, sprite, group):
+        if group not in self.buckets:
+            return
+
+        cells = self.get_cells(sprite.rect)
+        self.locations[group][sprite] = (cells, self.next_rank)
+        self.next_rank += 1
+
+        buckets = self.buckets[group]
+        for cell in cells:
+            buckets.setdefault(cell, set()).add(sprite)
+
+    def remove(self, sprite, group):
+        location = self.locations[group].pop(sprite, None)
+
+        if location is not None:
+            buckets = self.buckets[group]
+            for cell in location[0]:
+                bucket = buckets[cell]
+                bucket.discard(sprite)
+                if not bucket:
+                    del buckets[cell]
+
+    def discard(self, sprite):
+        for group in self.locations:
+            self.remove(sprite, group)
+
+    def move(self, sprite, group):
+        location = self.locations[group].get(sprite)
+
+        if location is None:
+            return
+
+        if not group.has(sprite):
+            self.remove(sprite, group)
+            return
+
+        old_cells, rank = location
+        new_cells = self.get_cells(sprite.rect)
+
+        if new_cells != old_cells:
+            buckets = self.buckets[group]
+            for cell in old_cells:
+                bucket = buckets[cell]
+                bucket.discard(sprite)
+                if not bucket:
+                    del buckets[cell]
+
+            for cell in new_cells:
+                buckets.setdefault(cell, set()).add(sprite)
+
+            self.locations[group][sprite] = (new_cells, rank)
+
+    def update(self, sprites=None):
+        for group in self.dynamic_groups:
+            locations = self.locations[group]
+
+            if sprites is None:
+                moved = list(locations)
+            else:
+                moved = [sprite for sprite in sprites if sprite in locations]
+
+            for sprite in moved:
+                self.move(sprite, group)
+
+    def query(self, rect, group):
+        buckets = self.buckets[group]
+        found = set()
+
+        left, top, right, bottom = self.get_cell_range(rect)
+
+        if (right - left + 1) * (bottom - top + 1) > len(buckets):
+            # Large area over a sparse group, cheaper to check the occupied cells
+            for (x, y), bucket in buckets.items():
+                if left <= x <= right and top <= y <= bottom:
+                    found.update(bucket)
+        else:
+            for x in range(left, right + 1):
+                for y in range(top, bottom + 1):
+                    bucket = buckets.get((x, y))
+                    if bucket:
+                        found.update(bucket)
+
+        return found
+
+    def collide_rect(self, rect, group):
+        hits = [other for other in self.query(rect, group) if rect.colliderect(other.rect)]
+
+        if len(hits) > 1:
+            locations = self.locations[group]
+            hits.sort(key=lambda other: locations[other][1])
+
+        return hits
+
+    def collide(self, sprite, group, dokill=False):
+        hits = self.collide_rect(sprite.rect, group)
+
+        if dokill:
+            for other in hits:
+                other.kill()
+                self.discard(other)
+
+        return hits
+
+    def collideany(self, sprite, group):
+        rect = sprite.rect
+
+        for other in self.query(rect, group):
+            if rect.colliderect(other.rect):
+                return other
+
+        return None
@@ -0,0 +1,130 @@
+"""
+Definition:
+Streams the entities of a very large level in and out, in square chunks around the camera.
+
+Responsibilities:
+- Split the level data into chunks by location, identifying each entry by its kind and index
+- Create the entities of chunks that come within a radius of the camera focus, adding them to
+  their world groups, the spatial hash and the baked terrain
+- Release entities that end up outside that radius, so memory and per-frame work depend on the
+  area around the camera rather than on the size of the level
+- Remember what happened to released entities: collected items and killed enemies stay gone, and
+  entities keep the attributes they list in persistent (e.g. a door stays unlocked)
+
+Trigger / Usage:
+- World builds a LevelStreamer in make_level() when settings.LEVEL_STREAMING is on, and calls
+  update(focus) when the hero is placed and at the start of every World.update().
+- Work is only done when the focus crosses into another chunk.
+- Terrain collision doesn't depend on what is loaded; World flags the whole tile map from the level data.
+- An enemy released away from its starting chunk comes back at its starting location the next
+  time that chunk is loaded.
+"""
+
+# Standard Library Imports
+import math
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+
+
+class LevelStreamer:
+
+    def __init__(self, world, chunk_size=settings.STREAMING_CHUNK_SIZE, radius=settings.STREAMING_RADIUS):
+        self.world = world
+        self.chunk_pixels = chunk_size * settings.GRID_SIZE
+        self.reach = math.ceil(radius / chunk_size)  # chunks kept loaded on each side of the focus chunk
+
+        self.chunks = {}  # (col, row) -> [(kind, index, entry)] of the level data in that chunk
+        self.loaded = set()  # chunks whose entities have been created
+        self.live = {}  # (kind, index) -> (sprite, group) of every entity created and not yet released
+        self.removed = set()  # (kind, index) of entities collected or killed, never created again
+        self.saved = {}  # (kind, index) -> {attribute: value} remembered from released entities
+
+        self.focus_chunk = None
+        self.region = None  # area whose entities are kept, in pixels
+
+        for kind in world.KINDS:
+            for index, entry in enumerate(world.data[kind] if kind in world.data else []):
+                col, row = self.get_location(entry)
+                key = (col // chunk_size, row // chunk_size)
+                self.chunks.setdefault(key, []).append((kind, index, entry))
+
+    def get_location(self, entry):
+        return entry['loc'] if isinstance(entry, dict) else entry
+
+    def get_wanted_chunks(self):
+        col, row = self.focus_chunk
+        reach = self.reach
+
+        return {(c, r) for c in range(col - reach, col + reach + 1) for r in range(row - reach, row + reach + 1)}
+
+    def update(self, focus):
+        size = self.chunk_pixels
+        focus_chunk = (int(focus[0] // size), int(focus[1] // size))
+
+        if focus_chunk == self.focus_chunk:
+            return
+
+        self.focus_chunk = focus_chunk
+        left = (focus_chunk[0] - self.reach) * size
+        top = (focus_chunk[1] - self.reach) * size
+        self.region = pygame.Rect(left, top, (2 * self.reach + 1) * size, (2 * self.reach + 1) * size)
+
+        wanted = self.get_wanted_chunks()
+        self.release()
+        self.loaded &= wanted
+
+        for key in wanted - self.loaded:
+            self.load(key)
+
+    def load(self, key):
+        self.loaded.add(key)
+
+        for kind, index, entry in self.chunks.get(key, []):
+            entity_id = (kind, index)
+
+            if entity_id not in self.live and entity_id not in self.removed:
+                self.create(entity_id, entry)
+
+    def create(self, entity_id, entry):
+        world = self.world
+        sprite, group = world.make_sprite(*entity_id, entry)
+
+        for name, value in self.saved.pop(entity_id, {}).items():
+            setattr(sprite, name, value)
+
+        group.add(sprite)
+        world.all_sprites.add(sprite)
+        if sprite.always_active:
+            world.always_active.add(sprite)
+
+        world.spatial_hash.add(sprite, group)
+        if group in world.terrain.groups:
+            world.terrain.invalidate(sprite.rect)
+
+        self.live[entity_id] = (sprite, group)
+
+    def release(self):
+        # Drop entities that were used up, and those outside the region (where they are now, not where they started)
+        world = self.world
+
+        for entity_id, (sprite, group) in list(self.live.items()):
+            if sprite.alive() and self.region.colliderect(sprite.rect):
+                continue
+
+            if not sprite.alive():
+                self.removed.add(entity_id)
+            elif sprite.persistent:
+                self.saved[entity_id] = {name: getattr(sprite, name) for name in sprite.persistent}
+
+            world.spatial_hash.discard(sprite)
+            sprite.kill()
+            world.previous_positions.pop(sprite, None)
+
+            if group in world.terrain.groups:
+                world.terrain.invalidate(sprite.rect)
+
+            del self.live[entity_id]
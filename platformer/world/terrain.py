@@ -0,0 +1,128 @@
+"""
+Definition:
+A pre-rendered layer of static terrain (water, platforms, climbables) split into fixed-size chunks.
+
+Responsibilities:
+- Bake each chunk that contains terrain into a single transparent surface, in the display format,
+  the first time it is drawn
+- Keep only a bounded number of baked chunks, freeing the least recently drawn ones, so memory
+  depends on what is on screen rather than on the size of the level
+- Preserve the layering of the baked groups (water below platforms below climbables)
+- Draw only the chunks that overlap the visible area, one blit per chunk, and count the rest as culled
+- Re-bake individual chunks after they are invalidated by a terrain change, freeing the stale image
+
+Trigger / Usage:
+- World builds a TerrainLayer at the end of make_level() and draws it before any moving sprites.
+- Call invalidate(rect) whenever a terrain sprite is added, removed or changes its image
+  (e.g. a BreakablePlatform breaking, or terrain streamed in or out by LevelStreamer). The affected
+  chunks are re-baked the next time they are drawn.
+"""
+
+# Standard Library Imports
+import math
+from collections import OrderedDict
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+
+
+class TerrainLayer:
+
+    def __init__(self, world, groups, chunk_size=settings.TERRAIN_CHUNK_SIZE, cache_size=settings.TERRAIN_CHUNK_CACHE):
+        self.world = world
+        self.groups = groups  # bottom layer first
+        self.chunk_pixels = chunk_size * settings.GRID_SIZE
+        self.cache_size = cache_size
+
+        self.chunks = OrderedDict()  # (col, row) -> Surface of each baked chunk with terrain, least recently drawn first
+        self.chunk_count = 0  # chunks baked and held in memory
+        self.dirty = set()  # chunks to bake the next time they are drawn
+        self.revision = 0  # bumped whenever the baked image may change
+
+        # Render stats from the last draw() call
+        self.drawn_chunks = 0
+        self.culled_chunks = 0
+
+        self.bake()
+
+    def get_chunk_keys(self, rect):
+        size = self.chunk_pixels
+
+        left = rect.left // size
+        top = rect.top // size
+        right = max(left, (rect.right - 1) // size)
+        bottom = max(top, (rect.bottom - 1) // size)
+
+        return [(col, row) for col in range(left, right + 1) for row in range(top, bottom + 1)]
+
+    def bake(self):
+        # Nothing is rendered yet, chunks with terrain are baked as they come into view
+        self.chunks = OrderedDict()
+        self.chunk_count = 0
+        self.dirty = set()
+
+        for group in self.groups:
+            for sprite in group:
+                self.dirty.update(self.get_chunk_keys(sprite.rect))
+
+    def bake_chunk(self, col, row):
+        size = self.chunk_pixels
+        chunk_rect = pygame.Rect(col * size, row * size, size, size)
+        chunk = None
+
+        for group in self.groups:
+            for sprite in self.world.spatial_hash.collide_rect(chunk_rect, group):
+                if chunk is None:
+                    chunk = pygame.Surface(chunk_rect.size, pygame.SRCALPHA).convert_alpha()
+
+                chunk.blit(sprite.image, [sprite.rect.x - chunk_rect.x, sprite.rect.y - chunk_rect.y])
+
+        self.chunks.pop((col, row), None)
+        if chunk is not None:
+            self.chunks[(col, row)] = chunk
+
+        self.chunk_count = len(self.chunks)
+
+    def evict(self, keep):
+        # Free the least recently drawn chunks, they are baked again if they come back into view
+        while len(self.chunks) > max(self.cache_size, keep):
+            key, _ = self.chunks.popitem(last=False)
+            self.dirty.add(key)
+
+        self.chunk_count = len(self.chunks)
+
+    def invalidate(self, rect):
+        # Stale images are freed right away, chunks out of view aren't re-baked until they're drawn
+        for key in self.get_chunk_keys(rect):
+            self.chunks.pop(key, None)
+            self.dirty.add(key)
+
+        self.chunk_count = len(self.chunks)
+        self.revision += 1
+
+    def draw(self, surface, offset_x=0, offset_y=0):
+        size = self.chunk_pixels
+        view = pygame.Rect(math.floor(offset_x), math.floor(offset_y), surface.get_width(), surface.get_height())
+
+        self.drawn_chunks = 0
+
+        for key in self.get_chunk_keys(view):
+            if key in self.dirty:
+                self.bake_chunk(*key)
+                self.dirty.discard(key)
+
+            chunk = self.chunks.get(key)
+
+            if chunk is not None:
+                self.chunks.move_to_end(key)
+
+                x = math.floor(key[0] * size - offset_x)
+                y = math.floor(key[1] * size - offset_y)
+                surface.blit(chunk, [x, y])
+                self.drawn_chunks += 1
+
+        self.evict(self.drawn_chunks)
+        self.culled_chunks = self.chunk_count - self.drawn_chunks
@@ -0,0 +1,154 @@
+"""
+Definition:
+A flat grid of per-cell terrain flags (solid, water) covering the whole level.
+
+Responsibilities:
+- Record which cells are covered by platforms and water when a level is built
+- Answer terrain collision queries by looking up the few cells a rect overlaps, so the cost
+  doesn't depend on level size or on how many tile sprites exist
+- Return the rects of colliding cells so collisions can be resolved against cell edges
+- Keep the patrol spans of the level: runs of solid cells side by side in a row, which walkers
+  can patrol without reaching a ledge
+
+Trigger / Usage:
+- World builds a TileMap in make_level() from its terrain groups, or straight from the cells in
+  the level data with add_cells() when the level is streamed (see LevelStreamer).
+- Entities call collide() and collideany() with the SOLID and WATER flags for platform and
+  water checks instead of testing platform and water sprites.
+- Terrain is grid-aligned (every tile is placed at location * GRID_SIZE). If it ever changes,
+  call add() or remove() for the changed sprites; only the spans they touch are recomputed.
+"""
+
+# Standard Library Imports
+
+# Third-Party Imports
+import pygame
+
+# Local Imports
+import settings
+
+
+class TileMap:
+
+    # Cell flags
+    SOLID = 1
+    WATER = 2
+
+    def __init__(self, cols, rows, tile_size=settings.GRID_SIZE):
+        self.cols = cols
+        self.rows = rows
+        self.tile_size = tile_size
+
+        self.flags = bytearray(cols * rows)  # row by row
+        self.spans = {}  # (col, row) of each solid cell -> (left, right) in pixels of its span
+        self.revision = 0  # bumped whenever the map changes, so walkers and EnemyEngine know to look again
+
+    def add(self, group, flag):
+        changed = {}  # row -> (left, right) columns changed in that row
+
+        for sprite in group:
+            left, top, right, bottom = self.get_cell_range(sprite.rect)
+
+            for row in range(top, bottom + 1):
+                for col in range(left, right + 1):
+                    self.flags[row * self.cols + col] |= flag
+
+                first, last = changed.get(row, (left, right))
+                changed[row] = (min(first, left), max(last, right))
+
+        self.update_spans(changed, flag)
+
+    def add_cells(self, cells, flag):
+        # Like add(), for one-tile terrain given as (col, row) cells instead of sprites
+        changed = {}
+
+        for col, row in cells:
+            if 0 <= col < self.cols and 0 <= row < self.rows:
+                self.flags[row * self.cols + col] |= flag
+
+                first, last = changed.get(row, (col, col))
+                changed[row] = (min(first, col), max(last, col))
+
+        self.update_spans(changed, flag)
+
+    def update_spans(self, changed, flag):
+        if flag & self.SOLID:
+            for row, (left, right) in changed.items():
+                self.find_spans(row, left, right)
+
+        self.revision += 1
+
+    def remove(self, sprite, flag):
+        left, top, right, bottom = self.get_cell_range(sprite.rect)
+
+        for row in range(top, bottom + 1):
+            for col in range(left, right + 1):
+                self.flags[row * self.cols + col] &= ~flag
+
+            if flag & self.SOLID:
+                self.find_spans(row, left, right)
+
+        self.revision += 1
+
+    def is_solid(self, col, row):
+        return 0 <= col < self.cols and 0 <= row < self.rows and self.flags[row * self.cols + col] & self.SOLID
+
+    def find_spans(self, row, left, right):
+        # Rescan the changed cells plus the runs of solid cells on either side of them
+        while self.is_solid(left - 1, row):
+            left -= 1
+        while self.is_solid(right + 1, row):
+            right += 1
+
+        col = left
+        while col <= right:
+            if self.is_solid(col, row):
+                start = col
+                while self.is_solid(col, row):
+                    col += 1
+
+                span = (start * self.tile_size, col * self.tile_size)
+                for span_col in range(start, col):
+                    self.spans[(span_col, row)] = span
+            else:
+                self.spans.pop((col, row), None)
+                col += 1
+
+    def get_span(self, col, row):
+        return self.spans.get((col, row))
+
+    def get_cell_range(self, rect):
+        # Cells a rect overlaps, clipped to the map (may be empty)
+        size = self.tile_size
+
+        left = max(rect.left // size, 0)
+        top = max(rect.top // size, 0)
+        right = min((rect.right - 1) // size, self.cols - 1)
+        bottom = min((rect.bottom - 1) // size, self.rows - 1)
+
+        return left, top, right, bottom
+
+    def get_rect(self, col, row):
+        size = self.tile_size
+        return pygame.Rect(col * size, row * size, size, size)
+
+    def collide(self, rect, flag):
+        left, top, right, bottom = self.get_cell_range(rect)
+        hits = []
+
+        for row in range(top, bottom + 1):
+            for col in range(left, right + 1):
+                if self.flags[row * self.cols + col] & flag:
+                    hits.append(self.get_rect(col, row))
+
+        return hits
+
+    def collideany(self, rect, flag):
+        left, top, right, bottom = self.get_cell_range(rect)
+
+        for row in range(top, bottom + 1):
+            for col in range(left, right + 1):
+                if self.flags[row * self.cols + col] & flag:
+                    return True
+
+        return False
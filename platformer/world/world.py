@@ -8,15 +8,34 @@ Responsibilities:
 - Track world dimensions and hero starting position
 - Provide centralized update and draw methods for all sprites
 - Manage layering of sprite rendering for consistent visual presentation
+- Own the spatial hash used to answer collision queries against each group
+- Own the tile map of static terrain (solid and water cells) used for terrain collision
+- Pre-render static terrain into chunks so it can be drawn with a few blits per frame
+- Draw the level's parallax background layers behind the terrain (see ParallaxBackground)
+- Cull sprites outside the camera view and count how many were drawn or culled
+- Remember where moving sprites were before the last update, so they can be drawn part of the
+  way between the last two simulation ticks
+- Only update entities inside an activation region around the camera, letting the rest sleep
+  (pre-rendered terrain is static and never updated)
+- Optionally advance simple enemies in one batch with NumPy (see EnemyEngine)
+- Optionally stream entities in and out in chunks around the camera, for very large levels
+  (see LevelStreamer)
 
 Trigger:
+- The Game class builds a World for each level. A World built with preload=True (e.g. on a
+  background thread) doesn't take in the hero until place_hero() is called.
 - The Game class calls World.update() every frame to advance all sprites.
 - The Game class calls World.draw(surface, offset_x, offset_y) every frame to render the world.
   Offsets are optional; they are used for scrolling but default to (0, 0) if not provided.
+- draw_background() and draw_sprites() can also be called separately, e.g. to cache the static
+  background for dirty-rect rendering. draw_sprites() returns the screen rects it drew to.
+- draw_sprites() takes an optional alpha (0 to 1) for interpolating between the previous and the
+  latest update; it defaults to 1, drawing sprites where they are.
 """
 
 # Standard Library Imports
 import json
+import math
 
 # Third-Party Imports
 import pygame
@@ -31,11 +50,21 @@ from platformer.entities.items import Gem, Heart, Key
 from platformer.entities.interactables import Door, NPC, Sign
 from platformer.entities.platforms import BreakablePlatform, Crate, ItemBlock, MovingPlatform, Platform
 from platformer.entities.triggers import Flag, Flagpole
+from platformer.world.enemy_engine import EnemyEngine
+from platformer.world.parallax import ParallaxBackground
+from platformer.world.spatial_hash import SpatialHash
+from platformer.world.streaming import LevelStreamer
+from platformer.world.terrain import TerrainLayer
+from platformer.world.tilemap import TileMap
 
 
 class World:
+
+    # Level data keys, in the order their sprites are built (and so updated and drawn within a group)
+    KINDS = ['grass_dirt', 'dirt', 'blocks', 'water', 'water_tops', 'clouds', 'spikeballs', 'spikemen', 'fish',
+             'gems', 'hearts', 'keys', 'doors', 'signs', 'npcs', 'ladders', 'goals']
     
-    def __init__(self, game, data):
+    def __init__(self, game, data, preload=False):
         self.game = game
         self.data = data  # could also pass in file and load in load_level (but then loading assets is in multiple places)
 
@@ -49,126 +78,296 @@ class World:
         self.water = pygame.sprite.Group()
         self.goals = pygame.sprite.Group()
         self.all_sprites = pygame.sprite.Group()
+        self.always_active = pygame.sprite.Group()
+
+        # Render stats from the last draw() call
+        self.drawn_sprites = 0
+        self.culled_sprites = 0
+
+        # Top-left of each sprite before the last update, for render interpolation
+        self.previous_positions = {}
+
+        # Collision index
+        self.spatial_hash = SpatialHash(settings.GRID_SIZE)
+
+        # Animations shared by every sprite of a kind
+        self.animations = {}
 
         self.make_level()
 
+        if not preload:
+            self.place_hero()
+
     def make_level(self):
         self.world_width = self.data['width'] * settings.GRID_SIZE
         self.world_height = self.data['height'] * settings.GRID_SIZE
 
-        self.hero = self.game.hero
-        self.players.add(self.hero)
-        self.hero.move_to(self.data['start'])
-        self.hero.respawn_point = self.data['start']
+        self.hero = None  # joins in place_hero()
+
+        if settings.LEVEL_STREAMING:
+            # Nothing yet, entities are created chunk by chunk around the camera
+            self.streamer = LevelStreamer(self)
+        else:
+            self.streamer = None
+
+            # Every sprite in the level, kind by kind
+            for kind in World.KINDS:
+                for index, entry in enumerate(self.data[kind] if kind in self.data else []):
+                    sprite, group = self.make_sprite(kind, index, entry)
+                    group.add(sprite)
+
+        # Index every group for collision queries, only players and enemies move
+        for group in [self.platforms, self.items, self.interactables, self.climbables, self.water, self.goals]:
+            self.spatial_hash.register(group)
+
+        for group in [self.players, self.enemies]:
+            self.spatial_hash.register(group, dynamic=True)
+
+        # Flag the cells covered by static terrain, for collision by cell lookup
+        self.tilemap = TileMap(self.data['width'], self.data['height'])
+
+        if self.streamer is not None:
+            # Streamed terrain is only partly loaded, so the whole map comes from the level data
+            for kinds, flag in [(['grass_dirt', 'dirt', 'blocks'], TileMap.SOLID),
+                                (['water', 'water_tops'], TileMap.WATER)]:
+                cells = [location for kind in kinds if kind in self.data for location in self.data[kind]]
+                self.tilemap.add_cells(cells, flag)
+        else:
+            self.tilemap.add(self.platforms, TileMap.SOLID)
+            self.tilemap.add(self.water, TileMap.WATER)
+
+        # Parallax layers behind the terrain
+        layers = self.data['background'] if 'background' in self.data else settings.BACKGROUND_LAYERS
+        self.background = ParallaxBackground(self.game.assets, layers)
+
+        # Bake static terrain, keeping the layering used in draw()
+        self.terrain = TerrainLayer(self, [self.water, self.platforms, self.climbables])
+
+        # Batched enemy physics, when enabled and NumPy is available (it needs every enemy up front, so not when streaming)
+        if settings.BATCHED_ENEMIES and EnemyEngine.supported and self.streamer is None:
+            self.enemy_engine = EnemyEngine(self)
+        else:
+            self.enemy_engine = None
+    
+    def get_animations(self, kind):
+        if kind not in self.animations:
+            assets = self.game.assets
+
+            if kind == 'clouds':
+                animations = {"default": assets.get_animation(settings.CLOUD_IMGS)}
+            elif kind == 'spikeballs':
+                animations = {"default": assets.get_animation(settings.SPIKEBALL_IMGS)}
+            elif kind == 'spikemen':
+                animations = {
+                    "walk_right": assets.get_animation(settings.SPIKEMAN_IMGS),
+                    "walk_left": assets.get_animation(settings.SPIKEMAN_IMGS, flip_x=True),
+                }
+            elif kind == 'fish':
+                animations = {
+                    "swim_left": assets.get_animation(settings.FISH_IMGS),
+                    "swim_right": assets.get_animation(settings.FISH_IMGS, flip_x=True),
+                }
+            elif kind == 'goals':
+                animations = {"default": assets.get_animation(settings.FLAG_IMGS)}
+
+            self.animations[kind] = animations
+
+        return self.animations[kind]
+
+    def make_sprite(self, kind, index, entry):
+        # Build one sprite from an entry of the level data, returns (sprite, group it belongs in).
+        # Images are loaded on first use, so only what this level needs gets decoded
+        assets = self.game.assets
 
         # Platforms
-        if 'grass_dirt' in self.data:   
-            for location in self.data['grass_dirt']:
-                self.platforms.add( Platform(self.game, location, self.game.grass_dirt_img) )
-
-        if 'dirt' in self.data:   
-            for location in self.data['dirt']:
-                self.platforms.add( Platform(self.game, location, self.game.dirt_img) )
-
-        if 'blocks' in self.data:    
-            for location in self.data['blocks']:
-                self.platforms.add( Platform(self.game, location, self.game.block_img) )
-        
+        if kind == 'grass_dirt':
+            return Platform(self.game, entry, assets.get_image(settings.GRASS_DIRT_IMG)), self.platforms
+
+        if kind == 'dirt':
+            return Platform(self.game, entry, assets.get_image(settings.DIRT_IMG)), self.platforms
+
+        if kind == 'blocks':
+            return Platform(self.game, entry, assets.get_image(settings.BLOCK_IMG)), self.platforms
+
         # Water
-        if 'water' in self.data:    
-            for location in self.data['water']:
-                self.water.add( Water(self.game, location, self.game.water_img) )
-        
-        if 'water_tops' in self.data:    
-            for location in self.data['water_tops']:
-                self.water.add( Water(self.game, location, self.game.water_top_img) )
-        
+        if kind == 'water':
+            return Water(self.game, entry, assets.get_image(settings.WATER_IMG)), self.water
+
+        if kind == 'water_tops':
+            return Water(self.game, entry, assets.get_image(settings.WATER_TOP_IMG)), self.water
+
         # Enemies
-        if 'clouds' in self.data:    
-            for location in self.data['clouds']:
-                self.enemies.add( Cloud(self.game, location, self.game.cloud_animations) )
-        
-        if 'spikeballs' in self.data:    
-            for location in self.data['spikeballs']:
-                self.enemies.add( Spikeball(self.game, location, self.game.spikeball_animations) )
-        
-        if 'spikemen' in self.data:    
-            for location in self.data['spikemen']:
-                self.enemies.add( Spikeman(self.game, location, self.game.spikeman_animations) )
-        
-        if 'fish' in self.data:    
-            for location in self.data['fish']:
-                self.enemies.add( Fish(self.game, location, self.game.fish_animations) )
-        
+        if kind == 'clouds':
+            return Cloud(self.game, entry, self.get_animations(kind)), self.enemies
+
+        if kind == 'spikeballs':
+            return Spikeball(self.game, entry, self.get_animations(kind)), self.enemies
+
+        if kind == 'spikemen':
+            return Spikeman(self.game, entry, self.get_animations(kind)), self.enemies
+
+        if kind == 'fish':
+            return Fish(self.game, entry, self.get_animations(kind)), self.enemies
+
         # Items
-        if 'gems' in self.data:    
-            for location in self.data['gems']:
-                self.items.add( Gem(self.game, location, self.game.gem_img) )
-        
-        if 'hearts' in self.data:    
-            for location in self.data['hearts']:
-                self.items.add( Heart(self.game, location, self.game.heart_img) )
-        
-        if 'keys' in self.data:    
-            for data in self.data['keys']:
-                location = data['loc']
-                code = data['code'] if 'code' in data else None                
-                self.items.add( Key(self.game, location, self.game.key_img, code) )
-        
+        if kind == 'gems':
+            return Gem(self.game, entry, assets.get_image(settings.GEM_IMG)), self.items
+
+        if kind == 'hearts':
+            return Heart(self.game, entry, assets.get_image(settings.HEART_IMG)), self.items
+
+        if kind == 'keys':
+            location = entry['loc']
+            code = entry['code'] if 'code' in entry else None
+            return Key(self.game, location, assets.get_image(settings.KEY_IMG), code), self.items
+
         # Interactables
-        if 'doors' in self.data:    
-            for data in self.data['doors']:
-                location = data['loc']
-                destination = data['dest']
-                code = data['code'] if 'code' in data else None
-                image = self.game.locked_door_img if 'code' in data else self.game.door_img
-                self.interactables.add( Door(self.game, location, image, destination, code) )
-        
-        if 'signs' in self.data:    
-            for data in self.data['signs']:
-                location = data['loc']
-                message = data['message']
-                self.interactables.add( Sign(self.game, location, self.game.sign_img, message) )
-
-        if 'npcs' in self.data:    
-            for data in self.data['npcs']:
-                location = data['loc']
-                message = data['message']
-                if data['type'] == 'shopkeeper':
-                    image = self.game.shopkeeper_img
-                elif data['type'] == 'wizard':
-                    image = self.game.wizard_img
-                self.interactables.add( NPC(self.game, location, image, message) )
-        
+        if kind == 'doors':
+            location = entry['loc']
+            destination = entry['dest']
+            code = entry['code'] if 'code' in entry else None
+            image = assets.get_image(settings.LOCKED_DOOR_IMG) if 'code' in entry else assets.get_image(settings.DOOR_IMG)
+            return Door(self.game, location, image, destination, code), self.interactables
+
+        if kind == 'signs':
+            location = entry['loc']
+            message = entry['message']
+            return Sign(self.game, location, assets.get_image(settings.SIGN_IMG), message), self.interactables
+
+        if kind == 'npcs':
+            location = entry['loc']
+            message = entry['message']
+            if entry['type'] == 'shopkeeper':
+                image = assets.get_image(settings.SHOPKEEPER_IMG)
+            elif entry['type'] == 'wizard':
+                image = assets.get_image(settings.WIZARD_IMG)
+            return NPC(self.game, location, image, message), self.interactables
+
         # Climbables
-        if 'ladders' in self.data:
-            for location in self.data['ladders']:
-                self.climbables.add( Ladder(self.game, location, self.game.ladder_img) )
-        
-        # Goals
-        if 'goals' in self.data:    
-            for i, location in enumerate(self.data['goals']):
-                if i == 0:
-                    self.goals.add( Flag(self.game, location, self.game.flag_animations) )
-                else:
-                    self.goals.add( Flagpole(self.game, location, self.game.flagpole_img) ) 
-
-        # Make one big sprite group for easy updating
+        if kind == 'ladders':
+            return Ladder(self.game, entry, assets.get_image(settings.LADDER_IMG)), self.climbables
+
+        # Goals, the first is the flag on top of the pole
+        if kind == 'goals':
+            if index == 0:
+                return Flag(self.game, entry, self.get_animations(kind)), self.goals
+            else:
+                return Flagpole(self.game, entry, assets.get_image(settings.FLAGPOLE_IMG)), self.goals
+
+        raise ValueError(f"unknown level data kind: {kind}")
+
+    def place_hero(self):
+        # The hero only joins the world here, so a preloaded world that's never used doesn't hold on to it
+        self.hero = self.game.hero
+        self.players.add(self.hero)
+        self.spatial_hash.add(self.hero, self.players)
+
+        # Make one big sprite group for easy updating, the hero first so it updates first
         self.all_sprites.add(self.players, self.platforms, self.enemies, self.items, 
                              self.interactables, self.climbables, self.water, self.goals)
-    
+
+        # Entities that opt out of sleeping
+        self.always_active.add(sprite for sprite in self.all_sprites if sprite.always_active)
+
+        self.hero.move_to(self.data['start'])
+        self.hero.respawn_point = self.data['start']
+        self.spatial_hash.move(self.hero, self.players)
+
+        if self.streamer is not None:
+            self.streamer.update(self.hero.rect.center)
+
+    def get_active_region(self):
+        offset_x, offset_y = self.game.camera.get_offsets()
+        margin = settings.ACTIVATION_MARGIN * settings.GRID_SIZE
+
+        region = pygame.Rect(math.floor(offset_x), math.floor(offset_y), settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+
+        return region.inflate(2 * margin, 2 * margin)
+
+    def get_active_sprites(self):
+        if settings.ACTIVATION_MARGIN is None:
+            return self.all_sprites.sprites()
+
+        region = self.get_active_region()
+        active = self.always_active.sprites()
+
+        # Same group order as all_sprites, so the hero still updates first
+        for group in [self.players, self.enemies, self.items, self.interactables, self.goals]:
+            for sprite in self.spatial_hash.collide_rect(region, group):
+                if sprite not in self.always_active:
+                    active.append(sprite)
+
+        return active
+
     def update(self):
-        self.all_sprites.update()
+        if self.streamer is not None:
+            self.streamer.update(self.game.camera.focus)
+
+        active = self.get_active_sprites()
+
+        # Batched enemies are stepped all at once, after the hero
+        if self.enemy_engine is not None:
+            active = [sprite for sprite in active if sprite not in self.enemy_engine.members]
+
+        self.previous_positions = {sprite: sprite.rect.topleft for sprite in active}
+
+        if self.game.profiler.get_enabled():
+            for sprite in active:
+                self.game.profiler.update_entity(sprite)
+        else:
+            for sprite in active:
+                sprite.update()
+
+        self.spatial_hash.update(active)
+
+        if self.enemy_engine is not None:
+            if self.game.profiler.get_enabled():
+                self.game.profiler.update_entity(self.enemy_engine)
+            else:
+                self.enemy_engine.update()
 
-    def draw(self, surface, offset_x=0, offset_y=0):
-        surface.fill(settings.SKY_BLUE)
+    def draw_background(self, surface, offset_x=0, offset_y=0):
+        self.background.draw(surface, offset_x, offset_y)
+
+        # Water, platforms and climbables are pre-rendered
+        self.terrain.draw(surface, offset_x, offset_y)
+
+    def get_draw_position(self, sprite, alpha):
+        x, y = sprite.rect.topleft
+
+        if alpha < 1.0 and sprite in self.previous_positions:
+            previous_x, previous_y = self.previous_positions[sprite]
+
+            # Teleports (respawning, doors) jump straight to the new position
+            if abs(x - previous_x) <= settings.GRID_SIZE and abs(y - previous_y) <= settings.GRID_SIZE:
+                x = previous_x + (x - previous_x) * alpha
+                y = previous_y + (y - previous_y) * alpha
+
+        return x, y
+
+    def draw_sprites(self, surface, offset_x=0, offset_y=0, alpha=1.0):
+        # Only sprites overlapping the camera view are drawn
+        view = pygame.Rect(math.floor(offset_x), math.floor(offset_y), surface.get_width(), surface.get_height())
+        self.drawn_sprites = 0
+        self.culled_sprites = 0
 
         # Draw sprites with desired layering
-        draw_order  = [self.water, self.platforms, self.climbables, self.interactables, 
-                       self.items, self.enemies, self.goals, self.players]
+        draw_order  = [self.interactables, self.items, self.enemies, self.goals, self.players]
+        rects = []
 
         for group in draw_order:
-            for sprite in group:
-                x = sprite.rect.x - offset_x
-                y = sprite.rect.y - offset_y
-                surface.blit(sprite.image, [x, y])
+            visible = self.spatial_hash.collide_rect(view, group)
+            self.drawn_sprites += len(visible)
+            self.culled_sprites += len(group) - len(visible)
+
+            for sprite in visible:
+                x, y = self.get_draw_position(sprite, alpha)
+                x -= offset_x
+                y -= offset_y
+                rects.append(surface.blit(sprite.image, [x, y]))
+
+        return rects
+
+    def draw(self, surface, offset_x=0, offset_y=0, alpha=1.0):
+        self.draw_background(surface, offset_x, offset_y)
+        return self.draw_sprites(surface, offset_x, offset_y, alpha)
@@ -5,8 +5,15 @@ This module centralizes constants, file paths, and default values used throughou
 the game. It includes:
 
 - Window settings (screen size, grid size, FPS, camera lag)
+- Rendering settings (terrain chunking, dirty-rect updates, scroll reuse, text cache, freeze frames)
+- Simulation settings (tick rate, catch-up cap, interpolation, activation margin, batched enemies,
+  level streaming)
+- Profiler settings
+- Input recording
 - Colors and fonts
 - File paths for images, sounds, and music
+- Mixer settings and sound effect priorities
+- Default parallax background layers
 - Level configuration and starting level
 - Default character attributes and physics
 - Gameplay controls mapping
@@ -24,9 +31,35 @@ GRID_SIZE = 64
 SCREEN_WIDTH = 16 * GRID_SIZE
 SCREEN_HEIGHT = 9 * GRID_SIZE
 CAPTION = "My Awesome Game"
-FPS = 60
+FPS = 60  # Frames drawn per second, 0 for uncapped (the simulation runs at TICK_RATE)
 CAMERA_LAG = 0.8
 
+# Rendering
+TERRAIN_CHUNK_SIZE = 16  # Width and height of each pre-rendered terrain chunk, in tiles
+TERRAIN_CHUNK_CACHE = 8  # Most baked terrain chunks kept in memory (4 MB each at 16 tiles), least recently drawn are freed first
+DIRTY_RECT_RENDERING = False  # Only push changed regions to the display while the camera is still
+SCROLL_REUSE_RENDERING = True  # Shift the last frame's background as the camera moves and draw only the newly exposed edges
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept for reuse by the overlays
+FREEZE_FRAME_DIM = 0  # Darken the frozen world behind menus and dialogs, 0 (off) to 255 (black)
+FREEZE_FRAME_BLUR = 0  # Blur radius for the frozen world behind menus and dialogs, 0 for none
+
+# Simulation
+TICK_RATE = 60  # Fixed simulation steps per second, independent of FPS
+MAX_CATCH_UP_TICKS = 5  # Most steps run before one frame is drawn, past this the game slows down instead
+INTERPOLATE_RENDERING = True  # Draw sprites and camera between the last two simulation steps
+ACTIVATION_MARGIN = 4  # Tiles beyond the screen edges where entities stay awake, None keeps everything awake
+BATCHED_ENEMIES = False  # Step clouds, fish, spikeballs and spikemen together with NumPy (needs numpy installed)
+LEVEL_STREAMING = False  # Create entities chunk by chunk near the camera and release them far from it (for very large levels)
+STREAMING_CHUNK_SIZE = 16  # Width and height of each streamed chunk, in tiles
+STREAMING_RADIUS = 24  # Tiles around the camera focus whose chunks are kept loaded, should reach past ACTIVATION_MARGIN
+
+# Profiler
+PROFILER_BUFFER_SIZE = 300  # Frames of timing history kept per phase
+PROFILER_DUMP_FILE = None  # e.g. 'profile.json' to save the timing history on exit
+
+# Input recording
+RECORD_INPUT_FILE = None  # e.g. 'session.rec' to record every tick's input for replay (see benchmarks.replay)
+
 # Define colors
 SKY_BLUE = (135, 200, 235)
 WHITE = (255, 255, 255)
@@ -84,6 +117,16 @@ LADDER_TOP_IMG = 'assets/images/climbables/ladder_top.png'
 WATER_IMG = 'assets/images/fluids/platformPack_tile017.png'
 WATER_TOP_IMG = 'assets/images/fluids/platformPack_tile005.png'
 
+''' backgrounds '''
+DAY_BACKGROUND_IMG = 'assets/images/backgrounds/final_day.png'
+
+# Parallax layers, back to front, for levels without a "background" list ([] for plain SKY_BLUE).
+# scroll is how far a layer moves per pixel the camera moves: 0 stays put, 1 moves with the world.
+# SCROLL_REUSE_RENDERING shifts the terrain alone when there are layers, and draws them under it.
+BACKGROUND_LAYERS = [
+    {'image': DAY_BACKGROUND_IMG, 'scroll': 0.25}
+]
+
 # Sounds
 JUMP_SND = 'assets/sounds/jump.wav'
 GEM_SND = 'assets/sounds/collect_point.wav'
@@ -92,6 +135,17 @@ GEM_SND = 'assets/sounds/collect_point.wav'
 TITLE_MUSIC = 'assets/music/calm_happy.ogg'
 MAIN_THEME = 'assets/music/cooking_mania.wav'
 
+# Sound effects
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16  # 16-bit signed samples
+MIXER_CHANNELS = 2  # Stereo
+MIXER_BUFFER = 256  # Samples per mixer buffer, smaller plays sooner after the event but may crackle (pygame default 512)
+SOUND_CHANNELS = 8  # Mixer channels reserved for effects, the most that play at once
+SOUND_EFFECTS = {  # name -> (file, priority), a busy channel goes to the higher priority effect
+    'jump': (JUMP_SND, 2),
+    'gem': (GEM_SND, 1),
+}
+
 # Levels
 STARTING_LEVEL = 8
 
@@ -109,6 +163,7 @@ LEVELS = [
 ]
 
 LEVEL_TRANSITION_TIME = 120
+PRELOAD_NEXT_LEVEL = True  # Build the next level on a background thread during the level complete screen
 
 # Default character attributes
 DEFAULT_ANIMATION_FRAME_RATE = 0.1